@@ -12,16 +12,17 @@ class MainController(QObject):
     data_updated = Signal(str, object)  # 数据更新信号
     status_changed = Signal(str)        # 状态改变信号
     
-    def __init__(self, view):
+    def __init__(self, view, service=None):
         """初始化主控制器
         
         Args:
             view: 主页面视图对象
+            service: 示例服务对象，默认为None，使用全局的ExampleService实例
         """
         super().__init__()
         self.view = view
         self.logger = LogManager()
-        self.example_service = ExampleService()
+        self.example_service = service if service is not None else ExampleService()
         
         # 连接视图信号到控制器槽函数
         self.view.action_triggered.connect(self.handle_action)
@@ -43,7 +44,8 @@ class MainController(QObject):
             action_type: 动作类型
             data: 相关数据
         """
-        self.logger.debug(f"处理动作: {action_type}, 数据: {data}")
+        if self.logger.debug_enabled:
+            self.logger.debug("处理动作: %s, 数据: %s", action_type, data)
         
         try:
             if action_type == 'initialize':
@@ -76,7 +78,8 @@ class MainController(QObject):
         Args:
             data_key: 请求的数据键
         """
-        self.logger.debug(f"请求数据: {data_key}")
+        if self.logger.debug_enabled:
+            self.logger.debug("请求数据: %s", data_key)
         
         try:
             if data_key == 'all':
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QLineEdit, QTextEdit, QGroupBox,
                              QFormLayout, QMessageBox)
-from PySide6.QtCore import Signal, Slot, Qt
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
 from chassis.core.log_manager import LogManager
 
 class MainView(QWidget):
@@ -14,6 +14,9 @@ class MainView(QWidget):
     action_triggered = Signal(str, object)  # 触发动作信号
     data_requested = Signal(str)            # 请求数据信号
     
+    # 界面刷新合并间隔（毫秒），短时间内的多次更新只渲染最后一次
+    UPDATE_INTERVAL_MS = 30
+    
     def __init__(self, parent=None):
         """初始化主页面视图
         
@@ -22,6 +25,20 @@ class MainView(QWidget):
         """
         super().__init__(parent)
         self.logger = LogManager()
+        
+        # 状态和数据显示的合并刷新定时器
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        self._pending_data = None
+        self._data_timer = QTimer(self)
+        self._data_timer.setSingleShot(True)
+        self._data_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._data_timer.timeout.connect(self._flush_data)
+        
         self.init_ui()
         self.logger.info("主视图初始化完成")
     
@@ -33,18 +50,25 @@ class MainView(QWidget):
         # 主布局
         main_layout = QVBoxLayout(self)
         
+        # 子组件样式统一设置，按objectName选择
+        self.setStyleSheet(
+            "#titleLabel { font-size: 20px; font-weight: bold; }"
+            " #statusLabel { color: blue; }"
+            " #dataDisplay { font-family: Consolas, monospace; }"
+        )
+        
         # 标题区域
-        title_label = QLabel("PySide6 框架示例")
+        title_label = QLabel("PySide6 框架示例", self)
+        title_label.setObjectName("titleLabel")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold;")
         main_layout.addWidget(title_label)
         
         # 数据操作区域
-        data_group = QGroupBox("数据操作")
-        data_layout = QFormLayout()
+        data_group = QGroupBox("数据操作", self)
+        data_layout = QFormLayout(data_group)
         
-        self.key_input = QLineEdit()
-        self.value_input = QLineEdit()
+        self.key_input = QLineEdit(data_group)
+        self.value_input = QLineEdit(data_group)
         
         data_layout.addRow("键:", self.key_input)
         data_layout.addRow("值:", self.value_input)
@@ -52,13 +76,13 @@ class MainView(QWidget):
         # 按钮布局
         buttons_layout = QHBoxLayout()
         
-        self.save_button = QPushButton("保存数据")
+        self.save_button = QPushButton("保存数据", data_group)
         self.save_button.clicked.connect(self.on_save_clicked)
         
-        self.load_button = QPushButton("加载数据")
+        self.load_button = QPushButton("加载数据", data_group)
         self.load_button.clicked.connect(self.on_load_clicked)
         
-        self.clear_button = QPushButton("清除缓存")
+        self.clear_button = QPushButton("清除缓存", data_group)
         self.clear_button.clicked.connect(self.on_clear_clicked)
         
         buttons_layout.addWidget(self.save_button)
@@ -66,30 +90,25 @@ class MainView(QWidget):
         buttons_layout.addWidget(self.clear_button)
         
         data_layout.addRow(buttons_layout)
-        data_group.setLayout(data_layout)
         main_layout.addWidget(data_group)
         
         # 数据显示区域
-        display_group = QGroupBox("数据显示")
-        display_layout = QVBoxLayout()
+        display_group = QGroupBox("数据显示", self)
+        display_layout = QVBoxLayout(display_group)
         
-        self.data_display = QTextEdit()
+        self.data_display = QTextEdit(display_group)
+        self.data_display.setObjectName("dataDisplay")
         self.data_display.setReadOnly(True)
-        self.data_display.setStyleSheet("font-family: Consolas, monospace;")
         
         display_layout.addWidget(self.data_display)
-        display_group.setLayout(display_layout)
         main_layout.addWidget(display_group)
         
         # 状态区域
-        self.status_label = QLabel("就绪")
+        self.status_label = QLabel("就绪", self)
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignLeft)
-        self.status_label.setStyleSheet("color: blue;")
         main_layout.addWidget(self.status_label)
         
-        # 设置布局
-        self.setLayout(main_layout)
-        
         # 发送初始化信号
         self.action_triggered.emit('initialize', None)
     
@@ -133,19 +152,25 @@ class MainView(QWidget):
             data: 数据值
         """
         self.logger.debug(f"更新数据显示: {data_key}")
+        self._pending_data = (data_key, data)
+        if not self._data_timer.isActive():
+            self._data_timer.start()
+    
+    def _flush_data(self):
+        """渲染最近一次的数据更新"""
+        data_key, data = self._pending_data
+        self._pending_data = None
         
         if data_key == 'all' and isinstance(data, dict):
             # 显示所有数据
-            text = "当前缓存数据:\n\n"
-            for key, value in data.items():
-                text += f"{key}: {value}\n"
-            self.data_display.setText(text)
+            body = "\n".join(f"{key}: {value}" for key, value in data.items())
+            self.data_display.setPlainText("当前缓存数据:\n\n" + body)
         elif data is not None:
             # 显示单个数据
-            self.data_display.setText(f"{data_key}: {data}")
+            self.data_display.setPlainText(f"{data_key}: {data}")
         else:
             # 无数据
-            self.data_display.setText("无数据")
+            self.data_display.setPlainText("无数据")
     
     @Slot(str)
     def update_status(self, status):
@@ -155,7 +180,13 @@ class MainView(QWidget):
             status: 状态文本
         """
         self.logger.debug(f"更新状态: {status}")
-        self.status_label.setText(f"状态: {status}")
+        self._pending_status = status
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """渲染最近一次的状态更新"""
+        self.status_label.setText(f"状态: {self._pending_status}")
     
     def closeEvent(self, event):
         """窗口关闭事件"""
@@ -5,20 +5,16 @@ from chassis.core.events.example_event import ExampleEvent
 class EventBus(QObject):
     def __init__(self):
         super().__init__()
-        self._events = {}
         self._register_events()
     
     def _register_events(self):
-        # 注册所有事件类
-        self._events['example'] = ExampleEvent()
+        # 注册所有事件类，直接作为实例属性访问
+        self.example = ExampleEvent()
     
     def get_event(self, event_name):
-        return self._events.get(event_name)
-    
-    # 快捷方法
-    @property
-    def example(self):
-        return self.get_event('example')
+        # 仅返回已注册的事件对象，避免把普通方法或属性当作事件返回
+        event = getattr(self, event_name, None)
+        return event if isinstance(event, QObject) else None
 
 
 # 实例化全局事件总线
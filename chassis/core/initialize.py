@@ -6,11 +6,47 @@
 import os
 import sys
 import json
+from pathlib import Path
+
 from chassis.core.log_manager import LogManager
 from chassis.utils.config_manager import ConfigManager
 from chassis.utils.file_utils import FileUtils
 
 
+# 默认配置，日志文件路径依赖配置目录，在写入时补充
+_DEFAULT_CONFIG = {
+    "application": {
+        "name": "PySide6 Framework",
+        "version": "1.0.0",
+        "debug_mode": True,
+        "theme": "light",
+        "language": "zh_CN",
+        "window_size": [1024, 768],
+        "window_position": [100, 100],
+        "auto_save": True
+    },
+    "logging": {
+        "level": "INFO",
+        "file_logging": True,
+        "max_bytes": 5242880,  # 5MB
+        "backup_count": 5
+    },
+    "services": {
+        "example_service": {
+            "enabled": True,
+            "cache_timeout": 300  # 5分钟
+        }
+    },
+    "ui": {
+        "font_family": "SimHei",
+        "font_size": 10,
+        "show_toolbar": True,
+        "show_statusbar": True,
+        "animation_enabled": True
+    }
+}
+
+
 def initialize_app():
     """初始化应用程序环境
     
@@ -34,10 +70,10 @@ def initialize_app():
         logger.info(f"配置目录: {config_dir}")
         
         # 创建配置目录
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
+        try:
+            Path(config_dir).mkdir(parents=True)
             logger.info(f"已创建配置目录: {config_dir}")
-        else:
+        except FileExistsError:
             logger.info("配置目录已存在")
         
         # 获取配置文件路径
@@ -47,37 +83,8 @@ def initialize_app():
         # 如果配置文件不存在，创建默认配置
         if not os.path.exists(config_path):
             # 创建默认配置
-            default_config = {
-                "application": {
-                    "name": "PySide6 Framework",
-                    "version": "1.0.0",
-                    "debug_mode": True,
-                    "theme": "light",
-                    "language": "zh_CN",
-                    "window_size": [1024, 768],
-                    "window_position": [100, 100],
-                    "auto_save": True
-                },
-                "logging": {
-                    "level": "INFO",
-                    "file_logging": True,
-                    "log_file": os.path.join(config_dir, "app.log"),
-                    "max_bytes": 5242880,  # 5MB
-                    "backup_count": 5
-                },
-                "services": {
-                    "example_service": {
-                        "enabled": True,
-                        "cache_timeout": 300  # 5分钟
-                    }
-                },
-                "ui": {
-                    "font_family": "SimHei",
-                    "font_size": 10,
-                    "show_toolbar": True,
-                    "show_statusbar": True,
-                    "animation_enabled": True
-                }
+            default_config = _DEFAULT_CONFIG | {
+                "logging": _DEFAULT_CONFIG["logging"] | {"log_file": os.path.join(config_dir, "app.log")}
             }
             
             # 保存默认配置
@@ -90,18 +97,18 @@ def initialize_app():
         
         # 创建日志目录
         log_dir = os.path.join(config_dir, "logs")
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        try:
+            Path(log_dir).mkdir(parents=True)
             logger.info(f"已创建日志目录: {log_dir}")
-        else:
+        except FileExistsError:
             logger.info("日志目录已存在")
         
         # 创建数据目录
         data_dir = os.path.join(config_dir, "data")
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        try:
+            Path(data_dir).mkdir(parents=True)
             logger.info(f"已创建数据目录: {data_dir}")
-        else:
+        except FileExistsError:
             logger.info("数据目录已存在")
         
         # 初始化完成
@@ -2,6 +2,7 @@
 """
 日志管理器模块，提供自定义的日志管理功能
 """
+import logging
 
 from chassis.core.log_manager.qt_handler import QtLogHandler
 from chassis.core.log_manager.log_manager import LogManager
@@ -19,6 +20,15 @@ def connect_log_text_signal(slot: callable) -> None:
     log_manager.qt_handler.connect_log_text_signal(slot)
 
 
+def connect_log_batch_signal(slot: callable) -> None:
+    """连接批量日志文本信号到槽函数
+    
+    Args:
+        slot: 槽函数，接收一个日志文本列表参数
+    """
+    log_manager.qt_handler.connect_log_batch_signal(slot)
+
+
 def connect_log_record_signal(slot: callable) -> None:
     """连接日志记录信号到槽函数
     
@@ -2,43 +2,342 @@
 """
 日志管理器模块
 """
+import atexit
 import logging
 import os
+import queue
+import stat
+import sys
+import threading
 import time
-from logging.handlers import RotatingFileHandler
-from typing import Optional, Dict
-
-from PySide6.QtCore import QObject
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
+from typing import Optional, Dict, List, Set
 
 from chassis.core.log_manager.qt_handler import QtLogHandler
 
+# 默认日志目录
+_DEFAULT_LOG_DIR = Path(__file__).resolve().parents[2] / 'logs'
+
+# 文件日志缓冲的记录条数，达到后一次性写入文件
+BUFFER_CAPACITY = 512
+# 缓冲日志的定时刷新间隔（秒），保证低频日志也能及时落盘
+BUFFER_FLUSH_INTERVAL = 1.0
+
+# 同时保留的测试日志器数量上限，超出时关闭最久未使用的测试日志文件
+MAX_TEST_LOGGERS = 64
+
+# 日志文件轮转的后台线程，按提交顺序依次处理各次轮转
+_ROTATION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-rot')
+
+
+class SharedFormatter(logging.Formatter):
+    """可在多个处理器间共享的格式化器
+
+    格式化结果按格式化器缓存在日志记录上，同一条记录经过共用该格式化器的多个处理器
+    （或同一处理器的多次格式化）时只格式化一次。格式化后的时间按日期格式缓存，
+    不同格式的SharedFormatter之间也只调用一次strftime。
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """格式化日志记录，命中缓存时直接返回
+        
+        Args:
+            record: 日志记录对象
+        
+        Returns:
+            str: 格式化后的文本
+        """
+        cache = record.__dict__.setdefault('_format_cache', {})
+        text = cache.get(self)
+        if text is None:
+            text = cache[self] = super().format(record)
+        return text
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """格式化日志时间，同一条记录相同日期格式只计算一次
+        
+        Args:
+            record: 日志记录对象
+            datefmt: 日期格式
+        
+        Returns:
+            str: 格式化后的时间
+        """
+        cache = record.__dict__.setdefault('_format_cache', {})
+        key = ('asctime', datefmt)
+        asctime = cache.get(key)
+        if asctime is None:
+            asctime = cache[key] = super().formatTime(record, datefmt)
+        return asctime
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """轮转文件处理器，缓存文件大小和文件类型判断
+
+    标准RotatingFileHandler在每条记录写入前都会检查文件是否存在、是否为普通文件，
+    并通过seek/tell获取当前大小。这里在打开文件时记录一次，之后按写入的字节数累加。
+    """
+    
+    _approx_size = 0
+    _is_regular = True
+    _pending_size = 0
+    
+    def _open(self):
+        """打开日志文件，并记录初始大小和是否为普通文件"""
+        stream = super()._open()
+        st = os.fstat(stream.fileno())
+        self._approx_size = st.st_size
+        self._is_regular = stat.S_ISREG(st.st_mode)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """根据缓存的文件大小判断是否需要轮转
+        
+        Args:
+            record: 日志记录对象
+        
+        Returns:
+            bool: 是否需要轮转
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._is_regular:
+            return False
+        msg = "%s\n" % self.format(record)
+        self._pending_size = len(msg.encode(self.encoding or 'utf-8', 'replace'))
+        # 与基类一致，空文件不轮转，避免单条超过maxBytes的记录每次都产生空的备份文件
+        if not self._approx_size:
+            return False
+        return self._approx_size + self._pending_size >= self.maxBytes
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """写入日志记录并累加文件大小
+        
+        Args:
+            record: 日志记录对象
+        """
+        super().emit(record)
+        self._approx_size += self._pending_size
+
+
+class AsyncRotatingFileHandler(FastRotatingFileHandler):
+    """在后台线程中完成备份文件轮转的文件处理器
+
+    轮转时只把当前日志文件改名为临时的待轮转文件并立即打开新文件，
+    备份文件的依次改名和删除交给后台线程，不阻塞正在写日志的线程。
+    解释器退出阶段后台线程已不再接收任务时，在当前线程同步完成轮转；
+    上次运行遗留的待轮转文件在创建处理器时并入备份序列。
+    """
+    
+    _pending_index = 0
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fold_stale_pending()
+    
+    def _fold_stale_pending(self) -> None:
+        """将遗留的待轮转文件按产生顺序依次并入备份序列"""
+        directory, base_name = os.path.split(self.baseFilename)
+        prefix = base_name + '.'
+        stale = []
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return
+        for name in names:
+            if name.startswith(prefix) and name.endswith('.pending'):
+                index = name[len(prefix):-len('.pending')]
+                if index.isdigit():
+                    stale.append((int(index), os.path.join(directory, name)))
+        # 序号小的先产生，最后并入的最新一份成为第一个备份
+        for _, pending_path in sorted(stale):
+            if self.backupCount > 0:
+                self._rotate_backups(pending_path)
+            else:
+                try:
+                    os.remove(pending_path)
+                except OSError:
+                    pass
+    
+    def doRollover(self) -> None:
+        """关闭当前文件、改名为待轮转文件并重新打开，备份改名交给后台线程"""
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+        
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        if os.path.exists(self.baseFilename):
+            self._pending_index += 1
+            pending_path = f"{self.baseFilename}.{self._pending_index}.pending"
+            os.rename(self.baseFilename, pending_path)
+            try:
+                _ROTATION_EXECUTOR.submit(self._rotate_backups, pending_path)
+            except RuntimeError:
+                # 解释器退出或执行器已关闭，不能再提交任务，直接同步轮转
+                self._rotate_backups(pending_path)
+        
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _rotate_backups(self, pending_path: str) -> None:
+        """依次后移备份文件，并将待轮转文件作为第一个备份
+        
+        Args:
+            pending_path: 待轮转文件路径
+        """
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+            dfn = self.rotation_filename(f"{self.baseFilename}.1")
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            self.rotate(pending_path, dfn)
+        except OSError:
+            if logging.raiseExceptions:
+                sys.stderr.write('--- Logging error during rollover ---\n')
+                traceback.print_exc(file=sys.stderr)
+
+
+class _ListenerTask:
+    """放入日志队列的任务，由监听线程在处理完之前入队的记录后执行"""
+    
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+    
+    def run(self) -> None:
+        """执行任务"""
+        self.func(*self.args)
+
+
+class _LogQueueListener(QueueListener):
+    """支持在监听线程中执行任务的队列监听器"""
+    
+    def handle(self, record) -> None:
+        """处理队列中的记录，遇到任务时在监听线程中执行
+        
+        Args:
+            record: 日志记录或任务
+        """
+        if isinstance(record, _ListenerTask):
+            record.run()
+            return
+        super().handle(record)
+
 
 class LogManager:
-    """日志管理器，负责管理不同类型的日志器"""
+    """日志管理器，负责管理不同类型的日志器
+
+    日志器上只挂载QueueHandler，调用线程仅负责入队；真正的控制台、文件和Qt
+    处理器由后台QueueListener线程统一执行，避免磁盘和界面延迟阻塞调用方。
+    文件处理器外包一层MemoryHandler，按批写入，ERROR及以上级别立即刷新。
+    main和test日志器不向根日志器传播，在根日志器上添加的处理器不会收到框架日志。
+    全局单例，重复调用LogManager()直接返回已初始化的实例。
+    """
+    
+    _instance = None
+    _initialized = False
+    # 已确认存在的目录，避免重复的mkdir系统调用
+    _ensured_dirs: Set[str] = set()
+    
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __init__(self, log_dir: Optional[str] = None):
         """初始化日志管理器
         
         Args:
-            log_dir: 日志目录，默认为None，会使用默认目录
+            log_dir: 日志目录，默认为None，会使用默认目录；仅首次创建时生效
         """
-        super().__init__()
+        if self._initialized:
+            return
         
         # 设置日志目录
-        if log_dir is None:
-            log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-        self.log_dir = log_dir
-        os.makedirs(self.log_dir, exist_ok=True)
+        self.log_dir = str(log_dir or _DEFAULT_LOG_DIR)
+        self._ensure_dir(self.log_dir)
+        
+        # 控制台和Qt处理器共用同一个格式化器
+        self._shared_formatter = SharedFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         
         # 初始化Qt日志处理器
-        self.qt_handler = QtLogHandler()
+        self.qt_handler = QtLogHandler(formatter=self._shared_formatter)
+        # 界面只显示INFO及以上级别，DEBUG记录不进入Qt信号路径
+        self.qt_handler.setLevel(logging.INFO)
         
-        # 存储测试日志器
-        self.test_loggers: Dict[str, logging.Logger] = {}
+        # 文件日志格式化器，主日志和测试日志共用
+        self._file_formatter = SharedFormatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s')
+        
+        # 创建测试日志目录
+        self._test_log_dir = os.path.join(self.log_dir, 'tests')
+        self._ensure_dir(self._test_log_dir)
+        
+        # 本次运行的时间标记，同一次运行的测试日志共享文件名后缀
+        self._run_token = time.strftime("%Y%m%d_%H%M%S")
+        
+        # 存储测试日志器（按最近使用排序）及其文件处理器
+        self.test_loggers: Dict[str, logging.Logger] = OrderedDict()
+        self._test_handlers: Dict[str, MemoryHandler] = {}
+        
+        # 日志队列：所有日志器共享一个队列和一个后台监听线程
+        self._log_queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(self._log_queue)
+        self._listener_lock = threading.Lock()
+        self._listener = _LogQueueListener(self._log_queue, respect_handler_level=True)
+        
+        # 带缓冲的文件处理器，由定时线程周期性刷新
+        self._buffered_handlers: List[MemoryHandler] = []
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name='log-flush', daemon=True)
         
         # 配置主日志
         self.main_logger = self._setup_main_logger()
+        
+        # 测试日志器的公共父日志器：队列处理器只挂在这里，test.*子日志器通过层级传播送入队列
+        self._test_root = logging.getLogger('test')
+        self._test_root.setLevel(logging.DEBUG)
+        self._test_root.addHandler(self._queue_handler)
+        self._test_root.propagate = False
+        
+        # 常用日志方法直接绑定到主日志器，调用时不再经过__getattr__
+        self.debug = self.main_logger.debug
+        self.info = self.main_logger.info
+        self.warning = self.main_logger.warning
+        self.error = self.main_logger.error
+        self.critical = self.main_logger.critical
+        self.exception = self.main_logger.exception
+        # 缓存DEBUG级别是否启用，供热点路径在构造日志参数前判断
+        self.debug_enabled = self.main_logger.isEnabledFor(logging.DEBUG)
+        
+        # 启动后台写日志线程和定时刷新线程，退出时刷新剩余的记录
+        self._listener.start()
+        self._flush_thread.start()
+        atexit.register(self.shutdown)
+        type(self)._initialized = True
 
+    def _ensure_dir(self, path: str) -> None:
+        """确保目录存在，每个目录只创建一次
+        
+        Args:
+            path: 目录路径
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
     def __getattr__(self, name):
         """
         将未在 LogManager 上定义的属性访问代理到主日志器，
@@ -46,6 +345,72 @@ class LogManager:
         """
         return getattr(self.main_logger, name)
     
+    def set_level(self, level) -> None:
+        """设置主日志器级别
+        
+        Args:
+            level: 日志级别，如 logging.DEBUG 或 'DEBUG'
+        """
+        self.main_logger.setLevel(level)
+        self.debug_enabled = self.main_logger.isEnabledFor(logging.DEBUG)
+    
+    def _add_listener_handlers(self, *handlers: logging.Handler) -> None:
+        """向后台监听线程追加处理器
+        
+        Args:
+            handlers: 要追加的处理器
+        """
+        with self._listener_lock:
+            self._listener.handlers += handlers
+    
+    def _remove_listener_handler(self, handler: logging.Handler) -> None:
+        """从后台监听线程移除处理器
+        
+        Args:
+            handler: 要移除的处理器
+        """
+        with self._listener_lock:
+            self._listener.handlers = tuple(h for h in self._listener.handlers if h is not handler)
+    
+    def _buffered(self, target: logging.Handler) -> MemoryHandler:
+        """为文件处理器包装一层批量写入的缓冲处理器
+        
+        Args:
+            target: 实际写文件的处理器
+        
+        Returns:
+            MemoryHandler: 缓冲处理器
+        """
+        buffered = MemoryHandler(
+            capacity=BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=target,
+            flushOnClose=True
+        )
+        buffered.setLevel(target.level)
+        self._buffered_handlers.append(buffered)
+        return buffered
+    
+    def _flush_loop(self) -> None:
+        """定时刷新所有缓冲处理器"""
+        while not self._flush_stop.wait(BUFFER_FLUSH_INTERVAL):
+            self.flush()
+    
+    def flush(self) -> None:
+        """将缓冲中的日志立即写入文件"""
+        for handler in self._buffered_handlers[:]:
+            handler.flush()
+    
+    def shutdown(self) -> None:
+        """停止后台线程并刷新所有缓冲的日志，重复调用无副作用"""
+        if self._flush_stop.is_set():
+            return
+        self._listener.stop()
+        self._flush_stop.set()
+        self.flush()
+        # 等待已提交的轮转完成，此后的轮转在调用线程中同步执行
+        _ROTATION_EXECUTOR.shutdown(wait=True)
+    
     def _setup_main_logger(self) -> logging.Logger:
         """设置主日志器
         
@@ -59,73 +424,104 @@ class LogManager:
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
         
+        # 主日志的控制台和文件处理器只处理main日志器的记录
+        main_filter = logging.Filter('main')
+        
         # 添加控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(self._shared_formatter)
+        console_handler.addFilter(main_filter)
         
         # 添加文件处理器（轮转）
         main_log_path = os.path.join(self.log_dir, 'main.log')
-        file_handler = RotatingFileHandler(
+        file_handler = AsyncRotatingFileHandler(
             main_log_path,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,  # 保留5个备份
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s')
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(self._file_formatter)
+        buffered_handler = self._buffered(file_handler)
+        buffered_handler.addFilter(main_filter)
         
-        # 添加Qt处理器
-        logger.addHandler(self.qt_handler)
+        # 真正的处理器（包括Qt处理器）交给后台线程，日志器上只挂队列处理器
+        self._add_listener_handlers(console_handler, buffered_handler, self.qt_handler)
+        logger.addHandler(self._queue_handler)
+        # 处理器已完整配置，不再遍历根日志器
+        logger.propagate = False
         
         return logger
     
     def get_test_logger(self, test_name: str) -> logging.Logger:
         """获取测试日志器
         
+        最多同时保留MAX_TEST_LOGGERS个测试日志器，超出时关闭最久未使用的测试日志文件。
+        
         Args:
             test_name: 测试名称
         
         Returns:
             logging.Logger: 测试日志器
         """
-        if test_name in self.test_loggers:
-            return self.test_loggers[test_name]
+        logger = self.test_loggers.get(test_name)
+        if logger is not None:
+            self.test_loggers.move_to_end(test_name)
+            return logger
+        
+        if len(self.test_loggers) >= MAX_TEST_LOGGERS:
+            self._evict_test_logger()
         
         logger = logging.getLogger(f'test.{test_name}')
         logger.setLevel(logging.DEBUG)
         
-        # 清除现有的处理器
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        
-        # 创建测试日志目录
-        test_log_dir = os.path.join(self.log_dir, 'tests')
-        os.makedirs(test_log_dir, exist_ok=True)
-        
         # 添加文件处理器（每个测试一个文件）
-        test_log_path = os.path.join(test_log_dir, f'{test_name}_{time.strftime("%Y%m%d_%H%M%S")}.log')
-        file_handler = RotatingFileHandler(
+        test_log_path = os.path.join(self._test_log_dir, f'{test_name}_{self._run_token}.log')
+        file_handler = AsyncRotatingFileHandler(
             test_log_path,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=3,  # 保留3个备份
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s')
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(self._file_formatter)
+        buffered_handler = self._buffered(file_handler)
+        # 只写入本测试日志器的记录
+        buffered_handler.addFilter(logging.Filter(logger.name))
         
-        # 添加Qt处理器
-        logger.addHandler(self.qt_handler)
+        # 文件处理器交给后台线程，Qt处理器已在监听线程中共享；
+        # 记录经由'test'父日志器的队列处理器入队，无需在每个测试日志器上添加处理器
+        self._add_listener_handlers(buffered_handler)
         
         self.test_loggers[test_name] = logger
+        self._test_handlers[test_name] = buffered_handler
         return logger
     
+    def _evict_test_logger(self) -> None:
+        """关闭最久未使用的测试日志器的文件处理器"""
+        test_name, _ = self.test_loggers.popitem(last=False)
+        buffered_handler = self._test_handlers.pop(test_name)
+        self._buffered_handlers.remove(buffered_handler)
+        # 队列中可能还有该测试的记录，且监听线程可能正在使用该处理器，
+        # 移除和关闭排在已入队的记录之后，由监听线程执行
+        task = _ListenerTask(self._close_listener_handler, buffered_handler)
+        if self._flush_stop.is_set():
+            task.run()
+        else:
+            self._log_queue.put_nowait(task)
+    
+    def _close_listener_handler(self, buffered_handler: MemoryHandler) -> None:
+        """从监听线程移除缓冲处理器，写出缓冲后关闭文件
+        
+        Args:
+            buffered_handler: 要关闭的缓冲处理器
+        """
+        self._remove_listener_handler(buffered_handler)
+        file_handler = buffered_handler.target
+        buffered_handler.close()
+        file_handler.close()
+    
     def get_main_logger(self) -> logging.Logger:
         """获取主日志器
         
@@ -3,19 +3,42 @@
 Qt日志处理器模块
 """
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, SIGNAL
+
+# 批量发送日志文本的间隔（毫秒）
+BATCH_INTERVAL_MS = 30
 
 
 class QLogSignals(QObject):
     """Qt日志信号类"""
     logRecordEmitted = Signal(logging.LogRecord)
     logTextEmitted = Signal(str)
+    logTextBatchEmitted = Signal(object)  # 参数为日志文本列表
+    batchPending = Signal()  # 内部信号：有待发送的批量日志
+
+
+# 所有Qt日志处理器共用的信号对象
+_SHARED_SIGNALS = QLogSignals()
+
+# 用于查询信号连接数的信号签名
+_RECORD_SIGNAL = SIGNAL("logRecordEmitted(PyObject)")
+_TEXT_SIGNAL = SIGNAL("logTextEmitted(QString)")
+_BATCH_SIGNAL = SIGNAL("logTextBatchEmitted(PyObject)")
 
 
 class QtLogHandler(logging.Handler):
-    """Qt日志处理器，通过信号发送日志"""
+    """Qt日志处理器，通过信号发送日志
+    
+    只向有槽函数连接的信号发送；文本信号无人连接时也不会格式化日志。
+    连接数在每次发送时查询，直接连接self.signals上的信号同样有效。
+    
+    日志文本按BATCH_INTERVAL_MS合并成一批，在信号对象所在线程（GUI线程）中
+    通过logTextBatchEmitted一次性发送，避免大量日志时每行一个跨线程事件。
+    所有处理器共用一个信号对象，连接到它的槽函数会收到所有处理器的日志。
+    """
     
     def __init__(self, formatter: Optional[logging.Formatter] = None):
         """初始化Qt日志处理器
@@ -27,7 +50,15 @@ class QtLogHandler(logging.Handler):
         if formatter is None:
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         self.setFormatter(formatter)
-        self.signals = QLogSignals()
+        self.signals = _SHARED_SIGNALS
+        
+        # 待批量发送的日志文本
+        self._pending: List[str] = []
+        self._pending_lock = threading.Lock()
+        self.signals.batchPending.connect(self._start_batch_timer, Qt.QueuedConnection)
+        
+        # 文本槽函数与其批量包装函数的对应关系，用于断开连接
+        self._text_slots: Dict[callable, callable] = {}
     
     def emit(self, record: logging.LogRecord) -> None:
         """处理日志记录，通过信号发送出去
@@ -35,19 +66,65 @@ class QtLogHandler(logging.Handler):
         Args:
             record: 日志记录对象
         """
+        signals = self.signals
+        
         # 发送完整的LogRecord对象
-        self.signals.logRecordEmitted.emit(record)
+        if signals.receivers(_RECORD_SIGNAL) > 0:
+            signals.logRecordEmitted.emit(record)
+        has_text_receivers = signals.receivers(_TEXT_SIGNAL) > 0
+        has_batch_receivers = signals.receivers(_BATCH_SIGNAL) > 0
+        if not (has_text_receivers or has_batch_receivers):
+            return
+        
         # 发送格式化后的日志文本
         log_text = self.format(record)
-        self.signals.logTextEmitted.emit(log_text)
+        if has_text_receivers:
+            signals.logTextEmitted.emit(log_text)
+        if has_batch_receivers:
+            with self._pending_lock:
+                first = not self._pending
+                self._pending.append(log_text)
+            # 每批只请求一次定时发送
+            if first:
+                signals.batchPending.emit()
+    
+    def _start_batch_timer(self) -> None:
+        """在GUI线程中启动批量发送定时器"""
+        QTimer.singleShot(BATCH_INTERVAL_MS, self._flush_batch)
+    
+    def _flush_batch(self) -> None:
+        """发送当前累积的日志文本"""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self.signals.logTextBatchEmitted.emit(batch)
 
     def connect_log_text_signal(self, slot: callable) -> None:
         """连接日志文本信号到槽函数
         
+        日志文本按批次送达，槽函数仍然每条日志调用一次。
+        
         Args:
             slot: 槽函数，接收一个字符串参数
         """
-        self.signals.logTextEmitted.connect(slot)
+        # 重复连接同一槽函数时保持原连接，避免旧的包装函数无法断开
+        if slot in self._text_slots:
+            return
+        
+        def deliver(batch):
+            for log_text in batch:
+                slot(log_text)
+        
+        self._text_slots[slot] = deliver
+        self.signals.logTextBatchEmitted.connect(deliver, Qt.QueuedConnection)
+
+    def connect_log_batch_signal(self, slot: callable) -> None:
+        """连接批量日志文本信号到槽函数
+        
+        Args:
+            slot: 槽函数，接收一个日志文本列表参数
+        """
+        self.signals.logTextBatchEmitted.connect(slot, Qt.QueuedConnection)
 
     def connect_log_record_signal(self, slot: callable) -> None:
         """连接日志记录信号到槽函数
@@ -56,3 +133,27 @@ class QtLogHandler(logging.Handler):
             slot: 槽函数，接收一个LogRecord参数
         """
         self.signals.logRecordEmitted.connect(slot)
+
+    def disconnect_log_text_signal(self, slot: callable) -> None:
+        """断开日志文本信号与槽函数的连接
+        
+        Args:
+            slot: 之前连接的槽函数
+        """
+        self.signals.logTextBatchEmitted.disconnect(self._text_slots.pop(slot))
+
+    def disconnect_log_batch_signal(self, slot: callable) -> None:
+        """断开批量日志文本信号与槽函数的连接
+        
+        Args:
+            slot: 之前连接的槽函数
+        """
+        self.signals.logTextBatchEmitted.disconnect(slot)
+
+    def disconnect_log_record_signal(self, slot: callable) -> None:
+        """断开日志记录信号与槽函数的连接
+        
+        Args:
+            slot: 之前连接的槽函数
+        """
+        self.signals.logRecordEmitted.disconnect(slot)
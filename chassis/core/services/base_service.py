@@ -8,17 +8,21 @@ class BaseService:
     
     def __init__(self):
         """初始化基础服务"""
-        self.logger = LogManager()
-        self.logger.debug(f"初始化服务: {self.__class__.__name__}")
+        lg = LogManager()
+        self.logger = lg
+        if lg.debug_enabled:
+            lg.debug("初始化服务: %s", self.__class__.__name__)
         
     def initialize(self):
         """服务初始化方法，子类可重写此方法进行初始化操作"""
-        self.logger.debug(f"服务初始化: {self.__class__.__name__}")
+        if self.logger.debug_enabled:
+            self.logger.debug("服务初始化: %s", self.__class__.__name__)
         return True
     
     def shutdown(self):
         """服务关闭方法，子类可重写此方法进行清理操作"""
-        self.logger.debug(f"服务关闭: {self.__class__.__name__}")
+        if self.logger.debug_enabled:
+            self.logger.debug("服务关闭: %s", self.__class__.__name__)
         return True
     
     def get_name(self):
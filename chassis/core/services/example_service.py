@@ -1,8 +1,10 @@
 from chassis.core.services.base_service import BaseService
+from chassis.utils.singleton import SingletonBase
 
-class ExampleService(BaseService):
+class ExampleService(BaseService, SingletonBase):
     """
     示例服务类，展示如何实现具体的业务逻辑服务
+    全局单例，应用和各控制器共享同一份数据缓存
     """
     
     def __init__(self):
@@ -26,7 +28,8 @@ class ExampleService(BaseService):
         Returns:
             获取的数据，如果不存在则返回None
         """
-        self.logger.debug(f"获取数据: {key}")
+        if self.logger.debug_enabled:
+            self.logger.debug("获取数据: %s", key)
         return self.data_cache.get(key)
     
     def set_data(self, key, value):
@@ -36,13 +39,15 @@ class ExampleService(BaseService):
             key: 数据键
             value: 数据值
         """
-        self.logger.debug(f"设置数据: {key} = {value}")
+        if self.logger.debug_enabled:
+            self.logger.debug("设置数据: %s = %s", key, value)
         self.data_cache[key] = value
         return True
     
     def clear_cache(self):
         """清空数据缓存"""
-        self.logger.debug("清空数据缓存")
+        if self.logger.debug_enabled:
+            self.logger.debug("清空数据缓存")
         self.data_cache.clear()
         return True
     
@@ -6,6 +6,7 @@
     消息提示框，非模态
 """
 import time
+from functools import partial
 
 from PySide6.QtWidgets import QWidget, QApplication
 from PySide6.QtCore import QTimer, Qt
@@ -14,11 +15,42 @@ from PySide6.QtGui import QIcon
 from qt_enhance.custom_widgets.message_tip.ui.MessageTip import Ui_MessageTip
 
 
-RECORDER = {}
+def _build_style(fg_color, bg_color):
+    """生成提示框的样式表，一次设置同时作用于背景框和文字"""
+    return (f"#frame {{ background-color: {bg_color}; border-radius: 8px; }}"
+            f" #label {{ color: {fg_color}; }}")
+
+
+# 当前存在的提示框，按创建顺序排列，用于计算堆叠位置
+_ACTIVE = []
+
+# 提示框图标缓存，需在QApplication创建后才能构造，因此首次使用时创建
+_ICONS = {}
+
+
+def _icon(name):
+    """获取共享的提示框图标"""
+    icon = _ICONS.get(name)
+    if icon is None:
+        icon = QIcon(f":images/png/{name}.png")
+        _ICONS[name] = icon
+    return icon
+
+
+def _release(tip):
+    """从记录中移除已关闭的提示框，重复移除时忽略"""
+    try:
+        _ACTIVE.remove(tip)
+    except ValueError:
+        pass
 
 
 class QMessageTip(QWidget):
-    _index = 0
+    # 预生成的主题样式表
+    _STYLE_INFO = _build_style("#003366", "#E6F2FF")  # 深蓝色文字, 浅蓝色背景
+    _STYLE_WARN = _build_style("#8C4200", "#FFF7E6")  # 深橙黄色文字, 浅橙黄色背景
+    _STYLE_SUCCESS = _build_style("#004D00", "#E6FFF2")  # 深绿色文字, 浅绿色背景
+    _STYLE_ERROR = _build_style("#8C0000", "#FFF0F0")  # 深红色文字, 浅红色背景
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -28,8 +60,7 @@ class QMessageTip(QWidget):
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        QMessageTip._index += 1
-        RECORDER[QMessageTip._index] = self
+        _ACTIVE.append(self)
 
     def set_icon(self, icon):
         self.ui.pushButton.setIcon(icon)
@@ -44,14 +75,11 @@ class QMessageTip(QWidget):
         @param bg_color: 背景颜色
         @return:
         """
-        self.ui.frame.setStyleSheet(f"background-color: {bg_color}; border-radius: 8px;")
-        self.ui.label.setStyleSheet(f"color: {fg_color};")
+        self.setStyleSheet(_build_style(fg_color, bg_color))
 
     def close_after_timer(self, interval):
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.close)
-        self._timer.setSingleShot(True)
-        self._timer.start(interval * 1000)
+        # 以自身为上下文的单次定时，提示框销毁后定时自动失效，无需单独的QTimer对象
+        QTimer.singleShot(int(interval * 1000), self, self.close)
 
     def show(self):
         """
@@ -59,24 +87,28 @@ class QMessageTip(QWidget):
         @return:
         """
         # 在用户当前屏幕居中显示
-        x = (QApplication.primaryScreen().geometry().width() - self.width()) // 2
-        y = (QApplication.primaryScreen().geometry().height() - self.height()) // 4
-        # 获取坐标此处的widget
-        widget = QApplication.widgetAt(x, y)
-        while isinstance(widget, QMessageTip):
-            y += widget.height() + 10
-            widget = QApplication.widgetAt(x, y)
+        geo = QApplication.primaryScreen().geometry()
+        sw, sh = geo.width(), geo.height()
+        w, h = self.width(), self.height()
+        x = (sw - w) // 2
+        y = (sh - h) // 4
+        # 排在最下方的已显示提示框之下，较早的提示框关闭后留下的空位不会导致重叠
+        bottoms = [tip.geometry().bottom() for tip in _ACTIVE if tip is not self and tip.isVisible()]
+        if bottoms:
+            y = max(y, max(bottoms) + 1 + 10)
         self.move(x, y)
         super().show()
 
-    def close(self):
+    def closeEvent(self, event):
         """
-        关闭提示框
+        关闭提示框，无论通过定时器、close()还是窗口系统关闭，都会释放记录
+        @param event: 关闭事件
         @return:
         """
-        self._timer.stop()
-        super().close()
-        del RECORDER[QMessageTip._index]
+        super().closeEvent(event)
+        if event.isAccepted():
+            # 延迟到事件循环中移除，避免在close调用过程中释放提示框对象
+            QTimer.singleShot(0, partial(_release, self))
 
     @staticmethod
     def information(text):
@@ -88,9 +120,8 @@ class QMessageTip(QWidget):
         window = QMessageTip()
         window.show()
         window.set_text(text)
-        window.set_icon(QIcon(":images/png/info.png"))
-        # 深蓝色文字, 浅蓝色背景
-        window.set_color("#003366", "#E6F2FF")
+        window.set_icon(_icon("info"))
+        window.setStyleSheet(QMessageTip._STYLE_INFO)
         window.close_after_timer(3)
 
     @staticmethod
@@ -103,9 +134,8 @@ class QMessageTip(QWidget):
         window = QMessageTip()
         window.show()
         window.set_text(text)
-        window.set_icon(QIcon(":images/png/warn.png"))
-        # 深橙黄色文字, 浅橙黄色背景
-        window.set_color("#8C4200", "#FFF7E6")
+        window.set_icon(_icon("warn"))
+        window.setStyleSheet(QMessageTip._STYLE_WARN)
         window.close_after_timer(3)
 
     @staticmethod
@@ -118,9 +148,8 @@ class QMessageTip(QWidget):
         window = QMessageTip()
         window.show()
         window.set_text(text)
-        window.set_icon(QIcon(":images/png/ok.png"))
-        # 深绿色文字, 浅绿色背景
-        window.set_color("#004D00", "#E6FFF2")
+        window.set_icon(_icon("ok"))
+        window.setStyleSheet(QMessageTip._STYLE_SUCCESS)
         window.close_after_timer(3)
 
     @staticmethod
@@ -133,9 +162,8 @@ class QMessageTip(QWidget):
         window = QMessageTip()
         window.show()
         window.set_text(text)
-        window.set_icon(QIcon(":images/png/fail.png"))
-        # 深红色文字, 浅红色背景
-        window.set_color("#8C0000", "#FFF0F0")
+        window.set_icon(_icon("fail"))
+        window.setStyleSheet(QMessageTip._STYLE_ERROR)
         window.close_after_timer(3)
 
 
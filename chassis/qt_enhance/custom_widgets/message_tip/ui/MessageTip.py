@@ -32,7 +32,6 @@ class Ui_MessageTip(object):
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.frame = QFrame(MessageTip)
         self.frame.setObjectName(u"frame")
-        self.frame.setStyleSheet(u"background-color: rgb(170, 255, 127);")
         self.frame.setFrameShape(QFrame.StyledPanel)
         self.frame.setFrameShadow(QFrame.Raised)
         self.horizontalLayout_2 = QHBoxLayout(self.frame)
@@ -56,8 +55,6 @@ class Ui_MessageTip(object):
         self.label.setMinimumSize(QSize(50, 0))
         self.label.setMaximumSize(QSize(400, 16777215))
         self.label.setFont(font)
-        self.label.setStyleSheet(u"color: rgb(0, 170, 0);\n"
-"color: rgb(0, 116, 0);")
         self.label.setWordWrap(True)
 
         self.horizontalLayout_2.addWidget(self.label)
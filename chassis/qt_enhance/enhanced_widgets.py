@@ -1,8 +1,119 @@
+import heapq
+import itertools
+import math
+import time
+import weakref
+
 from PySide6.QtWidgets import QPushButton, QLineEdit, QTextEdit, QStyle
-from PySide6.QtCore import Signal, Slot, Qt, QTimer
-from PySide6.QtGui import QFont, QColor, QPalette
+from PySide6.QtCore import QObject, Signal, Slot, Qt, QTimer, QSignalBlocker, SIGNAL
+from PySide6.QtGui import QFont, QColor, QPalette, QTextCursor
 from chassis.core.log_manager import LogManager
 
+# 用于查询接收者数量的信号签名
+_LENGTH_SIGNAL = SIGNAL("text_changed_with_length(QString,int)")
+
+# 组件共用的默认字体，首次使用时创建，避免导入时依赖QApplication
+_DEFAULT_FONT = None
+_CODE_FONT = None
+
+
+def _default_font():
+    """获取默认字体（10号）"""
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        font = QFont()
+        font.setPointSize(10)
+        _DEFAULT_FONT = font
+    return _DEFAULT_FONT
+
+
+def _code_font():
+    """获取等宽字体（Consolas 10号）"""
+    global _CODE_FONT
+    if _CODE_FONT is None:
+        _CODE_FONT = QFont("Consolas", 10)
+    return _CODE_FONT
+
+
+class _DebounceDispatcher(QObject):
+    """
+    延迟信号的共享调度器
+    所有输入组件共用一个QTimer，按截止时间堆排序，定时器总是对准最早的截止时间
+    """
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """获取全局唯一的调度器"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+        # 堆元素: (截止时间, 序号, 组件id, 组件弱引用)
+        self._heap = []
+        # 组件id -> 当前有效的截止时间，堆中截止时间不一致的条目视为已作废
+        self._deadlines = {}
+        self._counter = itertools.count()
+    
+    def schedule(self, widget, delay_ms):
+        """安排组件在delay_ms毫秒后发送延迟信号，覆盖之前的安排
+        
+        Args:
+            widget: 实现了_emit_delayed_signal的组件
+            delay_ms: 延迟时间（毫秒）
+        """
+        deadline = time.monotonic() * 1000 + delay_ms
+        key = id(widget)
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key, weakref.ref(widget)))
+        self._arm()
+    
+    def cancel(self, widget):
+        """取消组件尚未触发的延迟信号
+        
+        Args:
+            widget: 组件
+        
+        Returns:
+            是否存在待触发的延迟信号
+        """
+        return self._deadlines.pop(id(widget), None) is not None
+    
+    def _arm(self):
+        """丢弃堆顶的作废条目，并让定时器对准最早的截止时间"""
+        heap = self._heap
+        deadlines = self._deadlines
+        while heap and deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        if heap:
+            # 向上取整，避免剩余不足1毫秒时提前触发后反复重新计时
+            delay = max(0, math.ceil(heap[0][0] - time.monotonic() * 1000))
+            self._timer.start(delay)
+        else:
+            self._timer.stop()
+    
+    def _flush(self):
+        """发送所有已到期的延迟信号"""
+        heap = self._heap
+        deadlines = self._deadlines
+        now = time.monotonic() * 1000
+        while heap and heap[0][0] <= now:
+            deadline, _, key, ref = heapq.heappop(heap)
+            if deadlines.get(key) != deadline:
+                continue
+            del deadlines[key]
+            widget = ref()
+            if widget is not None:
+                widget._emit_delayed_signal()
+        self._arm()
+
+
 class EnhancedButton(QPushButton):
     """
     增强的按钮组件
@@ -13,6 +124,9 @@ class EnhancedButton(QPushButton):
     clicked_with_data = Signal(object)  # 带数据的点击信号
     double_clicked = Signal()           # 双击信号
     
+    # 日志管理器为全局单例，所有实例共用
+    logger = LogManager()
+    
     def __init__(self, text="", parent=None, **kwargs):
         """初始化增强按钮
         
@@ -26,7 +140,6 @@ class EnhancedButton(QPushButton):
                 - click_effect: 是否启用点击效果
         """
         super().__init__(text, parent)
-        self.logger = LogManager()
         
         # 配置选项
         self.auto_disable = kwargs.get('auto_disable', False)
@@ -39,22 +152,27 @@ class EnhancedButton(QPushButton):
         self._original_text = text
         self._is_loading = False
         
-        # 初始化样式
+        # 初始化样式，悬停样式预先生成
         self._original_style = self.styleSheet()
+        self._hover_style = self._original_style + "\nQPushButton:hover { background-color: #F0F0F0; }"
+        
+        # 点击效果使用的调色板，预先生成
+        self._original_palette = QPalette(self.palette())
+        self._highlight_palette = QPalette(self._original_palette)
+        self._highlight_palette.setColor(QPalette.Button, QColor("#D0D0D0"))
         
         # 连接信号
         self.clicked.connect(self._on_clicked)
         
         # 设置默认字体
-        font = QFont()
-        font.setPointSize(10)
-        self.setFont(font)
+        self.setFont(_default_font())
         
         # 设置最小尺寸
         self.setMinimumHeight(30)
         self.setMinimumWidth(80)
         
-        self.logger.debug(f"创建增强按钮: {text}")
+        if self.logger.debug_enabled:
+            self.logger.debug("创建增强按钮: %s", text)
     
     def _on_clicked(self):
         """内部点击处理"""
@@ -72,19 +190,17 @@ class EnhancedButton(QPushButton):
     def _apply_click_effect(self):
         """应用点击效果"""
         # 改变背景色，然后恢复
-        original_palette = self.palette()
-        
-        # 创建临时的高亮调色板
-        highlight_palette = QPalette(original_palette)
-        highlight_palette.setColor(QPalette.Button, QColor("#D0D0D0"))
-        
-        self.setPalette(highlight_palette)
+        self.setPalette(self._highlight_palette)
         
-        # 立即更新显示
-        self.repaint()
+        # 交由Qt合并重绘
+        self.update()
         
         # 定时器恢复原始样式
-        QTimer.singleShot(100, lambda: self.setPalette(original_palette))
+        QTimer.singleShot(100, self._restore_palette)
+    
+    def _restore_palette(self):
+        """恢复点击前的调色板"""
+        self.setPalette(self._original_palette)
     
     def _disable_temporarily(self):
         """临时禁用按钮"""
@@ -136,17 +252,26 @@ class EnhancedButton(QPushButton):
     def enterEvent(self, event):
         """鼠标进入事件"""
         if self.hover_effect and self.isEnabled():
-            # 创建临时的高亮样式
-            self.setStyleSheet(f"{self._original_style}\nQPushButton:hover {{ background-color: #F0F0F0; }}")
+            # 应用高亮样式
+            self._apply_style(self._hover_style)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """鼠标离开事件"""
         if self.hover_effect:
             # 恢复原始样式
-            self.setStyleSheet(self._original_style)
+            self._apply_style(self._original_style)
         super().leaveEvent(event)
     
+    def _apply_style(self, style):
+        """仅在样式表变化时设置，避免重复解析QSS
+        
+        Args:
+            style: 样式表字符串
+        """
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
+    
     def mouseDoubleClickEvent(self, event):
         """鼠标双击事件"""
         if event.button() == Qt.LeftButton:
@@ -164,6 +289,13 @@ class EnhancedLineEdit(QLineEdit):
     enter_pressed = Signal(str)        # 回车键按下信号
     validation_changed = Signal(bool)  # 验证状态变化信号
     
+    # 验证状态对应的样式表
+    _VALID_QSS = ""
+    _INVALID_QSS = "QLineEdit { border: 1px solid red; }"
+    
+    # 日志管理器为全局单例，所有实例共用
+    logger = LogManager()
+    
     def __init__(self, parent=None, **kwargs):
         """初始化增强行编辑
         
@@ -177,18 +309,12 @@ class EnhancedLineEdit(QLineEdit):
                 - echo_mode: 回显模式
         """
         super().__init__(parent)
-        self.logger = LogManager()
         
         # 配置选项
         self.delay_ms = kwargs.get('delay_ms', 300)
         self.validation_func = kwargs.get('validation_func', None)
         self._is_valid = True
         
-        # 初始化定时器用于延迟信号
-        self._delay_timer = QTimer(self)
-        self._delay_timer.setSingleShot(True)
-        self._delay_timer.timeout.connect(self._emit_delayed_signal)
-        
         # 设置属性
         if 'placeholder_text' in kwargs:
             self.setPlaceholderText(kwargs['placeholder_text'])
@@ -203,20 +329,18 @@ class EnhancedLineEdit(QLineEdit):
         self.textChanged.connect(self._on_text_changed)
         
         # 设置默认字体
-        font = QFont()
-        font.setPointSize(10)
-        self.setFont(font)
+        self.setFont(_default_font())
         
         # 设置最小高度
         self.setMinimumHeight(28)
         
-        self.logger.debug("创建增强行编辑")
+        if self.logger.debug_enabled:
+            self.logger.debug("创建增强行编辑")
     
     def _on_text_changed(self, text):
         """内部文本变化处理"""
-        # 重置定时器
-        self._delay_timer.stop()
-        self._delay_timer.start(self.delay_ms)
+        # 重新计时延迟信号
+        _DebounceDispatcher.instance().schedule(self, self.delay_ms)
         
         # 验证输入
         self._validate_input(text)
@@ -240,14 +364,13 @@ class EnhancedLineEdit(QLineEdit):
                     # 更新样式以反映验证状态
                     self._update_validation_style()
             except Exception as e:
-                self.logger.error(f"验证函数执行错误: {str(e)}")
+                self.logger.error("验证函数执行错误: %s", e)
     
     def _update_validation_style(self):
         """根据验证状态更新样式"""
-        if not self._is_valid:
-            self.setStyleSheet("QLineEdit { border: 1px solid red; }")
-        else:
-            self.setStyleSheet("")
+        target = self._VALID_QSS if self._is_valid else self._INVALID_QSS
+        if self.styleSheet() != target:
+            self.setStyleSheet(target)
     
     def keyPressEvent(self, event):
         """按键事件处理"""
@@ -289,8 +412,7 @@ class EnhancedLineEdit(QLineEdit):
     def focusOutEvent(self, event):
         """失去焦点事件"""
         # 确保发送最后的延迟信号
-        if self._delay_timer.isActive():
-            self._delay_timer.stop()
+        if _DebounceDispatcher.instance().cancel(self):
             self._emit_delayed_signal()
         super().focusOutEvent(event)
 
@@ -305,6 +427,9 @@ class EnhancedTextEdit(QTextEdit):
     text_changed_with_length = Signal(str, int)  # 带长度的文本变化信号
     cursor_position_changed = Signal(int, int)   # 光标位置变化信号
     
+    # 日志管理器为全局单例，所有实例共用
+    logger = LogManager()
+    
     def __init__(self, parent=None, **kwargs):
         """初始化增强文本编辑
         
@@ -317,7 +442,6 @@ class EnhancedTextEdit(QTextEdit):
                 - max_length: 最大长度
         """
         super().__init__(parent)
-        self.logger = LogManager()
         
         # 配置选项
         self.delay_ms = kwargs.get('delay_ms', 500)
@@ -325,50 +449,50 @@ class EnhancedTextEdit(QTextEdit):
         self.show_line_numbers = kwargs.get('show_line_numbers', False)
         self.max_length = kwargs.get('max_length', -1)  # -1表示无限长度
         
-        # 初始化定时器用于延迟信号
-        self._delay_timer = QTimer(self)
-        self._delay_timer.setSingleShot(True)
-        self._delay_timer.timeout.connect(self._emit_delayed_signal)
-        
         # 连接信号
         self.textChanged.connect(self._on_text_changed)
         self.cursorPositionChanged.connect(self._on_cursor_position_changed)
         
         # 设置默认字体（等宽字体适合代码编辑）
-        font = QFont("Consolas", 10)
-        self.setFont(font)
+        self.setFont(_code_font())
         
         # 设置最小尺寸
         self.setMinimumHeight(100)
         
-        self.logger.debug("创建增强文本编辑")
+        if self.logger.debug_enabled:
+            self.logger.debug("创建增强文本编辑")
     
     def _on_text_changed(self):
         """内部文本变化处理"""
+        # 文档字符数按UTF-16码元计算，不小于实际字符数，只用作判断是否可能超长的上限
+        upper_bound = self.document().characterCount() - 1
+        text = None
+        
         # 限制最大长度
-        if self.max_length > 0:
-            current_text = self.toPlainText()
-            if len(current_text) > self.max_length:
+        if self.max_length > 0 and upper_bound > self.max_length:
+            text = self.toPlainText()
+            if len(text) > self.max_length:
                 # 保存光标位置
                 cursor = self.textCursor()
                 position = cursor.position()
                 
-                # 截断文本
-                self.setPlainText(current_text[:self.max_length])
+                # 截断文本，屏蔽信号避免重入
+                text = text[:self.max_length]
+                with QSignalBlocker(self):
+                    self.setPlainText(text)
                 
-                # 恢复光标位置
-                cursor.setPosition(min(position, self.max_length))
+                # 恢复光标位置，位置同样按UTF-16码元计算
+                cursor.setPosition(min(position, self.document().characterCount() - 1))
                 self.setTextCursor(cursor)
-                
-                return
         
-        # 重置定时器
-        self._delay_timer.stop()
-        self._delay_timer.start(self.delay_ms)
+        # 重新计时延迟信号
+        _DebounceDispatcher.instance().schedule(self, self.delay_ms)
         
-        # 发送带长度的变化信号
-        current_text = self.toPlainText()
-        self.text_changed_with_length.emit(current_text, len(current_text))
+        # 发送带长度的变化信号，仅在有接收者时生成完整文本
+        if self.receivers(_LENGTH_SIGNAL):
+            if text is None:
+                text = self.toPlainText()
+            self.text_changed_with_length.emit(text, len(text))
     
     def _emit_delayed_signal(self):
         """发送延迟的文本变化信号"""
@@ -398,10 +522,10 @@ class EnhancedTextEdit(QTextEdit):
         # 处理退格键（处理缩进）
         if event.key() == Qt.Key_Backspace:
             cursor = self.textCursor()
-            # 检查光标前4个字符是否都是空格
-            cursor.movePosition(cursor.Left, cursor.KeepAnchor, 4)
-            selected_text = cursor.selectedText()
-            if selected_text == "    ":
+            # 检查光标前4个字符是否都是空格，确认后才移动光标
+            pos = cursor.positionInBlock()
+            if not cursor.hasSelection() and pos >= 4 and cursor.block().text()[pos - 4:pos] == "    ":
+                cursor.movePosition(QTextCursor.MoveOperation.Left, QTextCursor.MoveMode.KeepAnchor, 4)
                 cursor.removeSelectedText()
                 return
         
@@ -409,23 +533,13 @@ class EnhancedTextEdit(QTextEdit):
     
     def _handle_auto_indent(self):
         """处理自动缩进"""
-        cursor = self.textCursor()
-        current_block = cursor.block()
-        current_text = current_block.text()
+        current_text = self.textCursor().block().text()
         
         # 计算当前行的缩进级别
-        indent_level = 0
-        for char in current_text:
-            if char == ' ':
-                indent_level += 1
-            else:
-                break
-        
-        # 插入换行符
-        self.insertPlainText("\n")
+        indent_level = len(current_text) - len(current_text.lstrip(' '))
         
-        # 插入相同级别的缩进
-        self.insertPlainText(" " * indent_level)
+        # 插入换行符和相同级别的缩进
+        self.insertPlainText("\n" + " " * indent_level)
     
     def get_text_length(self):
         """获取文本长度
@@ -468,7 +582,6 @@ class EnhancedTextEdit(QTextEdit):
     def focusOutEvent(self, event):
         """失去焦点事件"""
         # 确保发送最后的延迟信号
-        if self._delay_timer.isActive():
-            self._delay_timer.stop()
+        if _DebounceDispatcher.instance().cancel(self):
             self._emit_delayed_signal()
         super().focusOutEvent(event)
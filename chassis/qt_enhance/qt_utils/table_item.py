@@ -5,10 +5,37 @@
 @Description: 
     This is a brief description of what the script does.
 """
+from functools import lru_cache
+
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import QTableWidgetItem
 
+# 只读表格项使用的标志掩码，去除可编辑标志
+_READONLY_MASK = ~Qt.ItemFlag.ItemIsEditable
+
+
+@lru_cache(maxsize=128)
+def _cached_brush(rgba):
+    """按颜色分量缓存画刷，大量单元格使用相同颜色时复用同一对象"""
+    return QBrush(QColor(*rgba))
+
+
+def _brush(color):
+    """将颜色转换为画刷
+
+    Args:
+        color: QColor 或 RGB/RGBA元组
+
+    Returns:
+        QBrush: 画刷
+    """
+    if isinstance(color, tuple):
+        return _cached_brush(color)
+    if isinstance(color, QColor):
+        return _cached_brush(color.getRgb())
+    return QBrush(color)
+
 
 def get_table_widget_item(text, font_color=None, background_color=None, alignment=None) -> QTableWidgetItem:
     """创建QTableWidgetItem，支持多种自定义选项
@@ -25,15 +52,11 @@ def get_table_widget_item(text, font_color=None, background_color=None, alignmen
     item = QTableWidgetItem(str(text))
     # 设置字体颜色
     if font_color:
-        if isinstance(font_color, tuple):
-            font_color = QColor(*font_color)
-        item.setForeground(QBrush(font_color))
+        item.setForeground(_brush(font_color))
 
     # 设置背景颜色
     if background_color:
-        if isinstance(background_color, tuple):
-            background_color = QColor(*background_color)
-        item.setBackground(QBrush(background_color))
+        item.setBackground(_brush(background_color))
 
     # 设置对齐方式
     if alignment:
@@ -44,7 +67,7 @@ def get_table_widget_item(text, font_color=None, background_color=None, alignmen
 def get_readonly_table_widget_item(text) -> QTableWidgetItem:
     """创建只读的QTableWidgetItem"""
     item = get_table_widget_item(text)
-    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+    item.setFlags(item.flags() & _READONLY_MASK)
     return item
 
 
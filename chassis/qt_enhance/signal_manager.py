@@ -1,48 +1,64 @@
+import warnings
+
 from PySide6.QtCore import QObject, Signal
 from chassis.core.log_manager import LogManager
-from chassis.utils.singleton import SingletonBase
+from chassis.utils.singleton import SingletonBase, SingletonMeta
+
+
+class _QSingletonMeta(type(QObject), SingletonMeta):
+    """QObject元类与单例元类的组合，解决两者同时使用时的元类冲突"""
+
 
-class SignalManager(QObject, SingletonBase):
+class SignalManager(QObject, SingletonBase, metaclass=_QSingletonMeta):
     """
     信号管理器，提供全局的信号通信机制
     允许不同模块和组件之间通过信号进行通信，无需直接引用
+    
+    预定义信号声明在类上，由Qt元对象系统绑定；自定义信号不创建Signal对象，
+    而是按名称保存槽函数列表，发射时直接调用，同时通过custom_signal_emitted通知Qt侧的监听者。
     """
     
+    # 预定义的全局信号
+    # UI相关信号
+    ui_theme_changed = Signal(str)  # 主题变化信号
+    ui_language_changed = Signal(str)  # 语言变化信号
+    ui_font_size_changed = Signal(int)  # 字体大小变化信号
+    
+    # 应用程序相关信号
+    app_initialized = Signal()  # 应用初始化完成信号
+    app_shutdown = Signal()  # 应用关闭信号
+    app_status_changed = Signal(str)  # 应用状态变化信号
+    
+    # 数据相关信号
+    data_updated = Signal(str, object)  # 数据更新信号
+    data_deleted = Signal(str, object)  # 数据删除信号
+    data_loaded = Signal(str, object)  # 数据加载信号
+    
+    # 错误相关信号
+    error_occurred = Signal(str, Exception)  # 错误发生信号
+    warning_occurred = Signal(str, str)  # 警告发生信号
+    
+    # 用户操作相关信号
+    user_logged_in = Signal(str)  # 用户登录信号
+    user_logged_out = Signal()  # 用户登出信号
+    user_permission_changed = Signal(list)  # 用户权限变化信号
+    
+    # 类上声明的预定义信号名称，在类定义时一次性收集；
+    # 收集在内部分发信号声明之前，custom_signal_emitted不属于预定义信号
+    _PREDEFINED_SIGNAL_NAMES = frozenset(
+        name for name, value in dict(locals()).items() if isinstance(value, Signal)
+    )
+    
+    # 自定义信号的通用分发信号：(信号名称, 数据)
+    custom_signal_emitted = Signal(str, object)
+    
     def __init__(self):
         """初始化信号管理器"""
-        if hasattr(self, 'initialized'):
-            return
-            
         super().__init__()
         self.logger = LogManager()
-        self._custom_signals = {}
+        # 自定义信号名称 -> 槽函数列表
+        self._custom_slots = {}
         self.logger.info("信号管理器初始化完成")
-        self.initialized = True
-        
-        # 预定义的全局信号
-        # UI相关信号
-        self.ui_theme_changed = Signal(str)  # 主题变化信号
-        self.ui_language_changed = Signal(str)  # 语言变化信号
-        self.ui_font_size_changed = Signal(int)  # 字体大小变化信号
-        
-        # 应用程序相关信号
-        self.app_initialized = Signal()  # 应用初始化完成信号
-        self.app_shutdown = Signal()  # 应用关闭信号
-        self.app_status_changed = Signal(str)  # 应用状态变化信号
-        
-        # 数据相关信号
-        self.data_updated = Signal(str, object)  # 数据更新信号
-        self.data_deleted = Signal(str, object)  # 数据删除信号
-        self.data_loaded = Signal(str, object)  # 数据加载信号
-        
-        # 错误相关信号
-        self.error_occurred = Signal(str, Exception)  # 错误发生信号
-        self.warning_occurred = Signal(str, str)  # 警告发生信号
-        
-        # 用户操作相关信号
-        self.user_logged_in = Signal(str)  # 用户登录信号
-        self.user_logged_out = Signal()  # 用户登出信号
-        self.user_permission_changed = Signal(list)  # 用户权限变化信号
     
     def register_signal(self, signal_name):
         """注册自定义信号
@@ -51,35 +67,33 @@ class SignalManager(QObject, SingletonBase):
             signal_name: 信号名称
             
         Returns:
-            创建的信号对象，如果信号已存在则返回现有信号
+            是否为新注册的信号，信号已存在时返回False
         """
-        if signal_name in self._custom_signals:
+        if signal_name in self._custom_slots or signal_name in self._PREDEFINED_SIGNAL_NAMES:
             self.logger.warning(f"信号已存在: {signal_name}")
-            return self._custom_signals[signal_name]
+            return False
         
-        # 创建新的信号
-        signal = Signal(object)
-        self._custom_signals[signal_name] = signal
-        self.logger.debug(f"注册自定义信号: {signal_name}")
-        return signal
+        self._custom_slots[signal_name] = []
+        if self.logger.debug_enabled:
+            self.logger.debug("注册自定义信号: %s", signal_name)
+        return True
     
     def get_signal(self, signal_name):
-        """获取信号
+        """获取预定义信号
+        
+        自定义信号没有对应的Signal对象，请通过connect_signal/emit_signal使用。
         
         Args:
             signal_name: 信号名称
             
         Returns:
-            信号对象，如果信号不存在则返回None
+            绑定到本实例的信号对象，如果不是预定义信号则返回None
         """
-        if signal_name in self._custom_signals:
-            return self._custom_signals[signal_name]
-        
-        # 检查是否为预定义信号
-        if hasattr(self, signal_name):
+        if signal_name in self._PREDEFINED_SIGNAL_NAMES:
             return getattr(self, signal_name)
         
-        self.logger.warning(f"信号不存在: {signal_name}")
+        if signal_name not in self._custom_slots:
+            self.logger.warning(f"信号不存在: {signal_name}")
         return None
     
     def emit_signal(self, signal_name, data=None):
@@ -92,19 +106,28 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             是否成功发射信号
         """
-        signal = self.get_signal(signal_name)
-        if signal:
-            try:
+        try:
+            if signal_name in self._PREDEFINED_SIGNAL_NAMES:
+                signal = getattr(self, signal_name)
                 if data is not None:
                     signal.emit(data)
                 else:
                     signal.emit()
-                self.logger.debug(f"发射信号: {signal_name}, 数据: {data}")
-                return True
-            except Exception as e:
-                self.logger.error(f"发射信号时出错: {signal_name}, 错误: {str(e)}")
-                return False
-        return False
+            else:
+                slots = self._custom_slots.get(signal_name)
+                if slots is None:
+                    self.logger.warning(f"信号不存在: {signal_name}")
+                    return False
+                for slot in slots:
+                    slot(data)
+                self.custom_signal_emitted.emit(signal_name, data)
+        except Exception as e:
+            self.logger.error(f"发射信号时出错: {signal_name}, 错误: {str(e)}")
+            return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("发射信号: %s, 数据: %s", signal_name, data)
+        return True
     
     def connect_signal(self, signal_name, slot):
         """连接信号到槽函数
@@ -116,16 +139,22 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             是否连接成功
         """
-        signal = self.get_signal(signal_name)
-        if signal:
+        slots = self._custom_slots.get(signal_name)
+        if slots is not None:
+            slots.append(slot)
+        else:
+            signal = self.get_signal(signal_name)
+            if signal is None:
+                return False
             try:
                 signal.connect(slot)
-                self.logger.debug(f"连接信号: {signal_name} 到槽函数: {slot.__name__}")
-                return True
             except Exception as e:
                 self.logger.error(f"连接信号时出错: {signal_name}, 错误: {str(e)}")
                 return False
-        return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("连接信号: %s 到槽函数: %s", signal_name, getattr(slot, '__name__', slot))
+        return True
     
     def disconnect_signal(self, signal_name, slot=None):
         """断开信号连接
@@ -137,20 +166,34 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             是否断开成功
         """
-        signal = self.get_signal(signal_name)
-        if signal:
+        slots = self._custom_slots.get(signal_name)
+        if slots is not None:
+            if slot is None:
+                slots.clear()
+            elif slot in slots:
+                slots.remove(slot)
+            else:
+                self.logger.error(f"断开信号时出错: {signal_name}, 错误: 槽函数未连接")
+                return False
+        else:
+            signal = self.get_signal(signal_name)
+            if signal is None:
+                return False
             try:
                 if slot:
                     signal.disconnect(slot)
-                    self.logger.debug(f"断开信号: {signal_name} 与槽函数: {slot.__name__} 的连接")
                 else:
                     signal.disconnect()
-                    self.logger.debug(f"断开信号: {signal_name} 的所有连接")
-                return True
             except Exception as e:
                 self.logger.error(f"断开信号时出错: {signal_name}, 错误: {str(e)}")
                 return False
-        return False
+        
+        if self.logger.debug_enabled:
+            if slot:
+                self.logger.debug("断开信号: %s 与槽函数: %s 的连接", signal_name, getattr(slot, '__name__', slot))
+            else:
+                self.logger.debug("断开信号: %s 的所有连接", signal_name)
+        return True
     
     def list_signals(self):
         """列出所有已注册的信号
@@ -158,18 +201,9 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             信号名称列表
         """
-        # 获取预定义信号
-        predefined_signals = []
-        for attr_name in dir(self):
-            if not attr_name.startswith('_') and isinstance(getattr(self, attr_name), Signal):
-                predefined_signals.append(attr_name)
-        
-        # 获取自定义信号
-        custom_signals = list(self._custom_signals.keys())
-        
         return {
-            'predefined_signals': predefined_signals,
-            'custom_signals': custom_signals
+            'predefined_signals': sorted(self._PREDEFINED_SIGNAL_NAMES),
+            'custom_signals': list(self._custom_slots)
         }
     
     def is_signal_registered(self, signal_name):
@@ -181,15 +215,7 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             信号是否已注册
         """
-        # 检查自定义信号
-        if signal_name in self._custom_signals:
-            return True
-        
-        # 检查预定义信号
-        if hasattr(self, signal_name) and isinstance(getattr(self, signal_name), Signal):
-            return True
-        
-        return False
+        return signal_name in self._custom_slots or signal_name in self._PREDEFINED_SIGNAL_NAMES
     
     def unregister_signal(self, signal_name):
         """注销自定义信号
@@ -200,25 +226,15 @@ class SignalManager(QObject, SingletonBase):
         Returns:
             是否注销成功
         """
-        if signal_name in self._custom_signals:
-            try:
-                # 断开所有连接
-                signal = self._custom_signals[signal_name]
-                try:
-                    signal.disconnect()
-                except:
-                    pass  # 忽略可能的断开连接错误
-                
-                # 删除信号
-                del self._custom_signals[signal_name]
-                self.logger.debug(f"注销自定义信号: {signal_name}")
-                return True
-            except Exception as e:
-                self.logger.error(f"注销信号时出错: {signal_name}, 错误: {str(e)}")
-                return False
+        if signal_name in self._custom_slots:
+            # 删除信号及其所有槽函数
+            del self._custom_slots[signal_name]
+            if self.logger.debug_enabled:
+                self.logger.debug("注销自定义信号: %s", signal_name)
+            return True
         
         # 不能注销预定义信号
-        if hasattr(self, signal_name) and isinstance(getattr(self, signal_name), Signal):
+        if signal_name in self._PREDEFINED_SIGNAL_NAMES:
             self.logger.warning(f"不能注销预定义信号: {signal_name}")
             return False
         
@@ -230,16 +246,16 @@ class SignalManager(QObject, SingletonBase):
         self.logger.info("信号管理器关闭中")
         
         # 断开所有自定义信号
-        for signal_name in list(self._custom_signals.keys()):
+        for signal_name in list(self._custom_slots.keys()):
             self.unregister_signal(signal_name)
         
-        # 断开所有预定义信号
-        for attr_name in dir(self):
-            if not attr_name.startswith('_') and isinstance(getattr(self, attr_name), Signal):
+        # 断开所有预定义信号；没有连接的信号断开时只会产生警告，予以忽略
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for signal_name in self._PREDEFINED_SIGNAL_NAMES:
                 try:
-                    signal = getattr(self, attr_name)
-                    signal.disconnect()
-                except:
-                    pass  # 忽略可能的断开连接错误
+                    getattr(self, signal_name).disconnect()
+                except (RuntimeError, TypeError):
+                    pass
         
         self.logger.info("信号管理器已关闭")
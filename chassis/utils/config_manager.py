@@ -1,23 +1,93 @@
+import atexit
+import copy
 import json
 import os
+import queue
+import threading
+import time
+from functools import lru_cache
 from chassis.core.log_manager import LogManager
 from chassis.utils.singleton import SingletonBase
+from chassis.utils.file_utils import BUFFER_SIZE, atomic_write_bytes, json_dumps, json_loads
+
+
+@lru_cache(maxsize=256)
+def _split_path(key_path):
+    """拆分点号分隔的配置键路径，结果缓存以便重复查询同一键时复用"""
+    return tuple(key_path.split('.'))
+
+
+def _flatten(data, prefix, index):
+    """将嵌套字典展开为点号路径到叶子值的映射，中间层字典不登记"""
+    for key, value in data.items():
+        if not isinstance(key, str):
+            continue
+        path = prefix + key
+        if isinstance(value, dict):
+            _flatten(value, path + '.', index)
+        else:
+            index[path] = value
+    return index
+
+
+def _index_value(index, path, value):
+    """在扁平索引中登记path下的配置值，字典值展开登记其叶子"""
+    if isinstance(value, dict):
+        _flatten(value, path + '.', index)
+    else:
+        index[path] = value
+
+
+def _unindex_value(index, path, value):
+    """从扁平索引中移除path下原有配置值登记的条目"""
+    if isinstance(value, dict):
+        for leaf_path in _flatten(value, path + '.', {}):
+            index.pop(leaf_path, None)
+    else:
+        index.pop(path, None)
+
+
+# 配置项不存在的标记，配置值本身可能为None
+_MISSING = object()
+
 
 class ConfigManager(SingletonBase):
     """
     配置管理器，用于处理应用程序配置的读取和保存
     支持JSON格式的配置文件操作
+    
+    save_config只标记并通知后台保存线程，SAVE_DELAY秒内的多次保存合并为一次原子写入，
+    调用线程不等待磁盘IO；需要立即落盘时调用flush，程序退出时也会自动flush。
+    
+    get对叶子配置项通过按需构建的扁平索引一次查找完成，set/remove只更新被修改路径下的索引条目，
+    set_all和重新加载配置时索引整体失效并在下次读取时重建。
+    中间层字典按路径查找并返回深拷贝，get_all同样返回深拷贝，外部修改返回值不会影响配置和索引。
     """
     
+    # 延迟保存的等待时间（秒）
+    SAVE_DELAY = 0.5
+    
     def __init__(self):
         """初始化配置管理器"""
-        if hasattr(self, 'initialized'):
-            return
-            
         self.logger = LogManager()
         self.config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
         self.config_file = os.path.join(self.config_dir, 'app_config.json')
         self.config_data = {}
+        # 点号路径到配置值的扁平索引，None表示需要重建
+        self._flat_index = None
+        
+        # 配置修改与保存之间的同步，以及延迟保存状态
+        self._lock = threading.RLock()
+        self._dirty = False
+        # 串行化文件写入，保证后生成的快照最后落盘
+        self._write_lock = threading.Lock()
+        # 最近一次读取或写入文件的内容，内容未变化时跳过写入
+        self._saved_payload = None
+        
+        # 后台保存线程，队列只容纳一个保存请求，多余的请求直接合并
+        self._save_queue = queue.Queue(maxsize=1)
+        self._saver = threading.Thread(target=self._saver_loop, name='ConfigSaver', daemon=True)
+        self._saver.start()
         
         # 创建配置目录
         if not os.path.exists(self.config_dir):
@@ -26,14 +96,17 @@ class ConfigManager(SingletonBase):
         
         # 加载配置文件
         self.load_config()
-        self.initialized = True
+        atexit.register(self.flush)
     
     def load_config(self):
         """加载配置文件"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config_data = json.load(f)
+                with open(self.config_file, 'rb', buffering=BUFFER_SIZE) as f:
+                    payload = f.read()
+                self.config_data = json_loads(payload)
+                self._flat_index = None
+                self._saved_payload = payload
                 self.logger.info(f"配置文件加载成功: {self.config_file}")
             else:
                 self.logger.info(f"配置文件不存在，将使用默认配置: {self.config_file}")
@@ -67,18 +140,65 @@ class ConfigManager(SingletonBase):
                 'window_size': {'width': 800, 'height': 600}
             }
         }
+        self._flat_index = None
         self.save_config()
     
     def save_config(self):
-        """保存配置到文件"""
+        """保存配置到文件
+        
+        标记配置需要保存并通知后台线程，在SAVE_DELAY秒后统一写入，期间的多次调用只写一次。
+        
+        Returns:
+            是否已安排保存
+        """
+        with self._lock:
+            self._dirty = True
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=4)
-            self.logger.info(f"配置文件保存成功: {self.config_file}")
-            return True
-        except Exception as e:
-            self.logger.error(f"保存配置文件时出错: {str(e)}")
-            return False
+            self._save_queue.put_nowait(None)
+        except queue.Full:
+            # 已有待处理的保存请求，本次修改会随之写入
+            pass
+        return True
+    
+    def _saver_loop(self):
+        """后台保存线程，收到请求后等待SAVE_DELAY秒再写入，合并期间的修改"""
+        while True:
+            self._save_queue.get()
+            time.sleep(self.SAVE_DELAY)
+            self.flush()
+    
+    def flush(self):
+        """立即将未保存的配置写入文件
+        
+        Returns:
+            是否保存成功，没有需要保存的修改时返回True
+        """
+        with self._write_lock:
+            # 持有配置锁的时间只用于生成快照，写文件期间不阻塞配置的读写
+            with self._lock:
+                if not self._dirty:
+                    return True
+                try:
+                    payload = json_dumps(self.config_data, indent=4)
+                except Exception as e:
+                    self.logger.error(f"保存配置文件时出错: {str(e)}")
+                    return False
+                self._dirty = False
+            
+            if payload == self._saved_payload:
+                if self.logger.debug_enabled:
+                    self.logger.debug("配置内容未变化，跳过保存")
+                return True
+            try:
+                atomic_write_bytes(self.config_file, payload)
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                self.logger.error(f"保存配置文件时出错: {str(e)}")
+                return False
+            self._saved_payload = payload
+        self.logger.info(f"配置文件保存成功: {self.config_file}")
+        return True
     
     def get(self, key_path, default=None):
         """获取配置值
@@ -88,18 +208,40 @@ class ConfigManager(SingletonBase):
             default: 默认值，当键不存在时返回
             
         Returns:
-            配置值或默认值
+            配置值或默认值；值为字典时返回其深拷贝，修改返回的字典不会改变配置，修改配置请使用set
         """
-        keys = key_path.split('.')
-        value = self.config_data
+        index = self._flat_index
+        if index is None:
+            index = self._build_index()
         
-        try:
-            for key in keys:
-                value = value[key]
+        value = index.get(key_path, _MISSING)
+        if value is not _MISSING:
             return value
-        except (KeyError, TypeError):
-            self.logger.warning(f"配置项不存在: {key_path}, 返回默认值: {default}")
-            return default
+        
+        # 中间层字典不在索引中，按路径查找并返回拷贝，避免外部修改绕过索引
+        with self._lock:
+            value = self.config_data
+            try:
+                for key in _split_path(key_path):
+                    value = value[key]
+            except (KeyError, TypeError, IndexError):
+                value = _MISSING
+            if isinstance(value, dict):
+                return copy.deepcopy(value)
+        self.logger.warning(f"配置项不存在: {key_path}, 返回默认值: {default}")
+        return default
+    
+    def _build_index(self):
+        """根据当前配置重建扁平索引
+        
+        Returns:
+            点号路径到叶子值的字典
+        """
+        with self._lock:
+            index = self._flat_index
+            if index is None:
+                index = self._flat_index = _flatten(self.config_data, '', {})
+            return index
     
     def set(self, key_path, value):
         """设置配置值
@@ -111,18 +253,31 @@ class ConfigManager(SingletonBase):
         Returns:
             是否设置成功
         """
-        keys = key_path.split('.')
+        keys = _split_path(key_path)
         config = self.config_data
         
         try:
-            # 导航到最后一个键的父级
-            for key in keys[:-1]:
-                if key not in config:
-                    config[key] = {}
-                config = config[key]
-            
-            # 设置值
-            config[keys[-1]] = value
+            with self._lock:
+                # 导航到最后一个键的父级
+                for key in keys[:-1]:
+                    if key not in config:
+                        config[key] = {}
+                    config = config[key]
+                
+                # 设置值
+                # 字典值保存拷贝，调用方之后修改原字典不会绕过索引
+                if isinstance(value, dict):
+                    value = copy.deepcopy(value)
+                old_value = config.get(keys[-1], _MISSING)
+                config[keys[-1]] = value
+                
+                # 只更新被修改路径下的索引条目
+                index = self._flat_index
+                if index is not None:
+                    if old_value is not _MISSING:
+                        _unindex_value(index, key_path, old_value)
+                    _index_value(index, key_path, value)
+                self._dirty = True
             self.logger.debug(f"设置配置: {key_path} = {value}")
             return True
         except Exception as e:
@@ -133,9 +288,10 @@ class ConfigManager(SingletonBase):
         """获取所有配置
         
         Returns:
-            配置字典
+            配置字典的深拷贝
         """
-        return self.config_data.copy()
+        with self._lock:
+            return copy.deepcopy(self.config_data)
     
     def set_all(self, config_data):
         """设置所有配置
@@ -148,7 +304,10 @@ class ConfigManager(SingletonBase):
         """
         try:
             if isinstance(config_data, dict):
-                self.config_data = config_data
+                with self._lock:
+                    self.config_data = copy.deepcopy(config_data)
+                    self._flat_index = None
+                    self._dirty = True
                 self.logger.info("设置所有配置成功")
                 return True
             else:
@@ -167,23 +326,28 @@ class ConfigManager(SingletonBase):
         Returns:
             是否删除成功
         """
-        keys = key_path.split('.')
+        keys = _split_path(key_path)
         config = self.config_data
         
         try:
-            # 导航到最后一个键的父级
-            for key in keys[:-1]:
-                if key not in config:
+            with self._lock:
+                # 导航到最后一个键的父级
+                for i in range(len(keys) - 1):
+                    config = config.get(keys[i])
+                    if not isinstance(config, dict):
+                        return False
+                
+                # 删除键
+                old_value = config.pop(keys[-1], _MISSING)
+                if old_value is _MISSING:
                     return False
-                config = config[key]
-            
-            # 删除键
-            if keys[-1] in config:
-                del config[keys[-1]]
-                self.logger.debug(f"删除配置: {key_path}")
-                return True
-            else:
-                return False
+                
+                # 只移除被删除路径下的索引条目
+                if self._flat_index is not None:
+                    _unindex_value(self._flat_index, key_path, old_value)
+                self._dirty = True
+            self.logger.debug(f"删除配置: {key_path}")
+            return True
         except Exception as e:
             self.logger.error(f"删除配置时出错: {str(e)}")
             return False
@@ -1,4 +1,5 @@
 import traceback
+from functools import wraps
 from chassis.core.log_manager import LogManager
 from chassis.utils.singleton import SingletonBase
 
@@ -8,13 +9,21 @@ class ErrorHandler(SingletonBase):
     提供错误捕获、日志记录和异常转换功能
     """
     
+    # 严重错误类型
+    _CRITICAL_ERRORS = (
+        SystemExit,
+        KeyboardInterrupt,
+        MemoryError,
+        ImportError,
+        NameError,
+        AttributeError,
+        TypeError,
+        ValueError,
+    )
+    
     def __init__(self):
         """初始化错误处理器"""
-        if hasattr(self, 'initialized'):
-            return
-            
         self.logger = LogManager()
-        self.initialized = True
     
     def handle_exception(self, exception, context="", show_traceback=True):
         """处理异常
@@ -55,20 +64,20 @@ class ErrorHandler(SingletonBase):
         Returns:
             装饰后的函数
         """
+        # 上下文与处理方法在装饰时确定，避免每次调用重复查找
+        handle_exception = self.handle_exception
+        context = f"执行 {func.__name__} 时出错"
+        
+        # 保留原函数的元数据
+        @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                context = f"执行 {func.__name__} 时出错"
-                self.handle_exception(e, context)
+                handle_exception(e, context)
                 # 返回None或默认值，取决于函数的预期返回值
                 return None
         
-        # 保留原函数的元数据
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
-        wrapper.__module__ = func.__module__
-        
         return wrapper
     
     def create_custom_error(self, message, error_type="CustomError"):
@@ -108,23 +117,7 @@ class ErrorHandler(SingletonBase):
         Returns:
             是否为严重错误
         """
-        # 定义严重错误类型列表
-        critical_errors = [
-            SystemExit,
-            KeyboardInterrupt,
-            MemoryError,
-            ImportError,
-            NameError,
-            AttributeError,
-            TypeError,
-            ValueError
-        ]
-        
-        for error_type in critical_errors:
-            if isinstance(exception, error_type):
-                return True
-        
-        return False
+        return isinstance(exception, self._CRITICAL_ERRORS)
     
     def handle_ui_error(self, exception, parent_widget=None):
         """处理UI相关错误
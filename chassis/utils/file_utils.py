@@ -1,11 +1,333 @@
+import codecs
+import errno
+import fnmatch
+import glob
+import math
+import mmap
 import os
+import re
 import shutil
+import stat
+import tempfile
 import json
-import yaml
+
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖，缺失时使用标准库json
+    orjson = None
 from datetime import datetime
 from chassis.core.log_manager import LogManager
 from chassis.utils.singleton import SingletonBase
 
+# 文件读写缓冲区大小，整块读写以减少系统调用次数
+BUFFER_SIZE = 1 << 20
+# 超过该大小的普通文件通过mmap读取
+MMAP_THRESHOLD = 64 * 1024
+# copy_file_range单次请求复制的字节数
+COPY_CHUNK_SIZE = 1 << 30
+# copy_file_range不可用时退回普通读写的错误码
+_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EPERM')
+    if hasattr(errno, name)
+)
+# 文件系统不支持硬链接时的错误码
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EPERM', 'EOPNOTSUPP', 'ENOTSUP', 'EMLINK', 'ENOSYS')
+    if hasattr(errno, name)
+)
+
+
+# 20位及以上的数字可能超出orjson支持的64位整数范围，解析时交给标准库
+_LONG_NUMBER_BYTES = re.compile(rb'\d{20,}')
+_LONG_NUMBER_STR = re.compile(r'\d{20,}')
+
+
+def _has_non_finite(data):
+    """判断数据中是否含有NaN或Infinity浮点数"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def json_dumps(data, indent=4):
+    """将数据序列化为UTF-8编码的JSON字节串
+    
+    安装了orjson时使用orjson，缩进统一为2个空格（orjson仅支持该缩进）。
+    超过64位的整数以及NaN/Infinity（orjson会写成null）使用标准库json序列化，保证结果与标准库一致。
+    
+    Args:
+        data: 要序列化的数据
+        indent: 缩进空格数，为None或0时不缩进
+        
+    Returns:
+        JSON字节串
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            payload = orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            # 超过64位的整数等orjson不支持的数据，由标准库处理或报错
+            payload = None
+        # 只有输出中含null时才可能是NaN/Infinity被改写，此时再检查原数据
+        if payload is not None and (b'null' not in payload or not _has_non_finite(data)):
+            return payload
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def json_loads(data):
+    """解析JSON
+    
+    orjson会将超过64位的整数解析为浮点数，且不支持NaN/Infinity，这两种情况使用标准库json解析。
+    
+    Args:
+        data: JSON字符串或UTF-8字节串（bytes/bytearray/memoryview/mmap）
+        
+    Returns:
+        解析后的对象
+    """
+    if orjson is not None:
+        long_number = _LONG_NUMBER_STR if isinstance(data, str) else _LONG_NUMBER_BYTES
+        if long_number.search(data) is None:
+            try:
+                if isinstance(data, mmap.mmap):
+                    # orjson不直接接受mmap，通过memoryview零拷贝传入，用完立即释放
+                    with memoryview(data) as view:
+                        return orjson.loads(view)
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity等标准库可以解析的写法，交给标准库再试一次
+                pass
+    if not isinstance(data, (str, bytes, bytearray)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(file_path, data):
+    """原子写入文件
+    
+    先写入同目录下的临时文件并落盘，再替换目标文件，写入过程中崩溃不会损坏原文件。
+    
+    Args:
+        file_path: 文件路径
+        data: 要写入的字节串
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    tmp = tempfile.NamedTemporaryFile(
+        'wb', buffering=BUFFER_SIZE, dir=directory,
+        prefix=os.path.basename(file_path) + '.', suffix='.tmp', delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_fd(src_fd, dst_fd):
+    """在两个文件描述符之间复制全部内容
+    
+    优先使用copy_file_range在内核中完成复制，不支持时（如跨文件系统）退回到read/write循环，
+    从当前偏移继续复制。
+    """
+    try:
+        while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE) > 0:
+            pass
+        return
+    except OSError as e:
+        if e.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+    while True:
+        buf = os.read(src_fd, BUFFER_SIZE)
+        if not buf:
+            break
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+
+def _copy_file(source_path, destination_path, overwrite):
+    """复制文件内容及权限、访问和修改时间
+    
+    支持copy_file_range的平台上直接操作文件描述符：先确认源文件为普通文件且与目标不是同一文件，
+    再写入目标目录下的临时文件并替换目标，复制失败不会破坏已存在的目标文件；
+    源文件不是普通文件或其他平台使用shutil.copy2。
+    
+    Raises:
+        FileNotFoundError: 源文件或目标目录不存在
+        FileExistsError: 不允许覆盖且目标文件已存在
+        shutil.SameFileError: 源文件与目标文件相同
+    """
+    if not hasattr(os, 'copy_file_range'):
+        _copy_file_fallback(source_path, destination_path, overwrite)
+        return
+    
+    src_fd = os.open(source_path, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        if not stat.S_ISREG(st.st_mode):
+            _copy_file_fallback(source_path, destination_path, overwrite)
+            return
+        
+        try:
+            dst_st = os.stat(destination_path)
+        except FileNotFoundError:
+            dst_st = None
+        if dst_st is not None:
+            if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+                raise shutil.SameFileError(f"{source_path!r} and {destination_path!r} are the same file")
+            if not overwrite:
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), destination_path)
+            # 与shutil.copy2一致，目标为符号链接时写入其指向的文件
+            destination_path = os.path.realpath(destination_path)
+        
+        directory = os.path.dirname(os.path.abspath(destination_path))
+        dst_fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=os.path.basename(destination_path) + '.', suffix='.tmp'
+        )
+        try:
+            try:
+                _copy_fd(src_fd, dst_fd)
+                os.fchmod(dst_fd, stat.S_IMODE(st.st_mode))
+                os.utime(dst_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+            if overwrite:
+                os.replace(tmp_path, destination_path)
+            else:
+                _publish_exclusive(tmp_path, destination_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    finally:
+        os.close(src_fd)
+
+
+def _publish_exclusive(tmp_path, destination_path):
+    """将临时文件发布为目标文件，目标已存在时抛出FileExistsError且不覆盖
+    
+    通过硬链接发布，检查之后才出现的目标文件同样不会被覆盖；文件系统不支持硬链接时，
+    先以O_EXCL创建占位文件占住目标路径，再用临时文件替换占位文件。
+    """
+    try:
+        os.link(tmp_path, destination_path)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+        os.close(os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+        os.replace(tmp_path, destination_path)
+    else:
+        os.unlink(tmp_path)
+
+
+def _copy_file_fallback(source_path, destination_path, overwrite):
+    """使用shutil.copy2复制文件，不允许覆盖时先检查目标是否存在"""
+    if not overwrite and os.path.exists(destination_path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), destination_path)
+    shutil.copy2(source_path, destination_path)
+
+
+def _iter_files(directory_path, pattern, recursive):
+    """逐个产出目录中匹配模式的文件路径
+    
+    基于os.scandir，文件类型取自目录项本身，无需对每个条目再次stat。与glob一致，
+    以'.'开头的条目只在模式也以'.'开头时匹配，递归时跳过隐藏目录且不进入符号链接目录。
+    
+    模式中含路径分隔符时（如'sub/*.py'）无法只按文件名匹配，改用glob。
+    
+    Raises:
+        FileNotFoundError: 顶层目录不存在
+        NotADirectoryError: 顶层路径不是目录
+    """
+    if '/' in pattern or os.sep in pattern:
+        yield from _glob_files(directory_path, pattern, recursive)
+        return
+    
+    match_hidden = pattern.startswith('.')
+    pending = [directory_path]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            if current is directory_path:
+                raise
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                hidden = name.startswith('.')
+                try:
+                    if entry.is_file():
+                        if (match_hidden or not hidden) and fnmatch.fnmatch(name, pattern):
+                            yield entry.path
+                    elif recursive and not hidden and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+        # 逆序压栈，保持目录按扫描顺序展开
+        pending.extend(reversed(subdirs))
+
+
+def _glob_files(directory_path, pattern, recursive):
+    """通过glob匹配含路径分隔符的模式，只返回文件"""
+    if not os.path.isdir(directory_path):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), directory_path)
+    if recursive:
+        search_path = os.path.join(directory_path, '**', pattern)
+    else:
+        search_path = os.path.join(directory_path, pattern)
+    for path in glob.iglob(search_path, recursive=recursive):
+        if os.path.isfile(path):
+            yield path
+
+
+def _is_utf8(encoding):
+    """判断编码是否为UTF-8"""
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _read_file(file_path, convert):
+    """读取文件内容并转换
+    
+    大于MMAP_THRESHOLD的普通文件映射到内存后直接交给convert，省去一次读缓冲区拷贝。
+    
+    Args:
+        file_path: 文件路径
+        convert: 接收文件内容（bytes或mmap）并返回结果的函数
+    """
+    with open(file_path, 'rb', buffering=BUFFER_SIZE) as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # 检查大小后文件被截断为空时无法映射，改为普通读取
+                return convert(f.read())
+            with mm:
+                return convert(mm)
+        return convert(f.read())
+
+
 class FileUtils(SingletonBase):
     """
     文件工具类，提供文件和目录操作的常用功能
@@ -14,11 +336,44 @@ class FileUtils(SingletonBase):
     
     def __init__(self):
         """初始化文件工具类"""
-        if hasattr(self, 'initialized'):
-            return
-            
         self.logger = LogManager()
-        self.initialized = True
+    
+    def _ensure_parent_dir(self, file_path):
+        """创建文件所在的目录
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            是否创建了目录，文件路径不含目录或目录已存在时返回False
+        """
+        directory = os.path.dirname(file_path)
+        if not directory:
+            return False
+        try:
+            os.makedirs(directory)
+        except FileExistsError:
+            return False
+        self.logger.info(f"创建目录: {directory}")
+        return True
+    
+    def _open_for_write(self, file_path, mode, **kwargs):
+        """打开文件用于写入，目录不存在时创建后重试
+        
+        Args:
+            file_path: 文件路径
+            mode: 打开模式
+            **kwargs: 传给open的其他参数
+            
+        Returns:
+            文件对象
+        """
+        try:
+            return open(file_path, mode, **kwargs)
+        except FileNotFoundError:
+            if not self._ensure_parent_dir(file_path):
+                raise
+            return open(file_path, mode, **kwargs)
     
     def read_text_file(self, file_path, encoding='utf-8'):
         """读取文本文件
@@ -31,13 +386,17 @@ class FileUtils(SingletonBase):
             文件内容字符串，失败返回None
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            self.logger.debug(f"读取文件成功: {file_path}")
-            return content
-        except Exception as e:
+            content = _read_file(file_path, lambda buf: str(buf, encoding))
+        except (OSError, UnicodeError, LookupError) as e:
             self.logger.error(f"读取文件失败: {file_path}, 错误: {str(e)}")
             return None
+        
+        # 与文本模式读取保持一致，统一换行符
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        if self.logger.debug_enabled:
+            self.logger.debug("读取文件成功: %s", file_path)
+        return content
     
     def write_text_file(self, file_path, content, encoding='utf-8', overwrite=True):
         """写入文本文件
@@ -52,26 +411,20 @@ class FileUtils(SingletonBase):
             是否写入成功
         """
         try:
-            # 检查文件是否已存在
-            if os.path.exists(file_path) and not overwrite:
-                self.logger.warning(f"文件已存在且不允许覆盖: {file_path}")
-                return False
-            
-            # 确保目录存在
-            directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                self.logger.info(f"创建目录: {directory}")
-            
-            # 写入文件
-            with open(file_path, 'w', encoding=encoding) as f:
+            # 不允许覆盖时以独占模式创建，文件已存在则抛出FileExistsError
+            mode = 'w' if overwrite else 'x'
+            with self._open_for_write(file_path, mode, encoding=encoding, buffering=BUFFER_SIZE) as f:
                 f.write(content)
-            
-            self.logger.debug(f"写入文件成功: {file_path}")
-            return True
-        except Exception as e:
+        except FileExistsError:
+            self.logger.warning(f"文件已存在且不允许覆盖: {file_path}")
+            return False
+        except (OSError, UnicodeError, LookupError) as e:
             self.logger.error(f"写入文件失败: {file_path}, 错误: {str(e)}")
             return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("写入文件成功: %s", file_path)
+        return True
     
     def read_json_file(self, file_path, encoding='utf-8'):
         """读取JSON文件
@@ -84,16 +437,21 @@ class FileUtils(SingletonBase):
             解析后的JSON对象，失败返回None
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                data = json.load(f)
-            self.logger.debug(f"读取JSON文件成功: {file_path}")
-            return data
+            if _is_utf8(encoding):
+                # UTF-8内容直接解析字节，无需先解码
+                data = _read_file(file_path, json_loads)
+            else:
+                data = _read_file(file_path, lambda buf: json_loads(str(buf, encoding)))
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON文件格式错误: {file_path}, 错误: {str(e)}")
             return None
-        except Exception as e:
+        except (OSError, UnicodeError, LookupError) as e:
             self.logger.error(f"读取JSON文件失败: {file_path}, 错误: {str(e)}")
             return None
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("读取JSON文件成功: %s", file_path)
+        return data
     
     def write_json_file(self, file_path, data, encoding='utf-8', overwrite=True, indent=4):
         """写入JSON文件
@@ -109,26 +467,26 @@ class FileUtils(SingletonBase):
             是否写入成功
         """
         try:
-            # 检查文件是否已存在
-            if os.path.exists(file_path) and not overwrite:
-                self.logger.warning(f"文件已存在且不允许覆盖: {file_path}")
-                return False
+            # 先序列化为完整字符串，再一次性写入
+            payload = json_dumps(data, indent=indent)
+            if not _is_utf8(encoding):
+                payload = payload.decode('utf-8').encode(encoding)
             
-            # 确保目录存在
-            directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                self.logger.info(f"创建目录: {directory}")
-            
-            # 写入文件
-            with open(file_path, 'w', encoding=encoding) as f:
-                json.dump(data, f, ensure_ascii=False, indent=indent)
-            
-            self.logger.debug(f"写入JSON文件成功: {file_path}")
-            return True
-        except Exception as e:
+            # 不允许覆盖时以独占模式创建，文件已存在则抛出FileExistsError
+            mode = 'wb' if overwrite else 'xb'
+            with self._open_for_write(file_path, mode, buffering=BUFFER_SIZE) as f:
+                f.write(payload)
+        except FileExistsError:
+            self.logger.warning(f"文件已存在且不允许覆盖: {file_path}")
+            return False
+        except (OSError, TypeError, ValueError, LookupError) as e:
+            # TypeError/ValueError来自无法序列化的数据，ValueError也包括编码错误
             self.logger.error(f"写入JSON文件失败: {file_path}, 错误: {str(e)}")
             return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("写入JSON文件成功: %s", file_path)
+        return True
     
     def create_directory(self, directory_path):
         """创建目录
@@ -140,16 +498,16 @@ class FileUtils(SingletonBase):
             是否创建成功
         """
         try:
-            if not os.path.exists(directory_path):
-                os.makedirs(directory_path)
-                self.logger.info(f"创建目录成功: {directory_path}")
-                return True
-            else:
-                self.logger.warning(f"目录已存在: {directory_path}")
-                return False
-        except Exception as e:
+            os.makedirs(directory_path)
+        except FileExistsError:
+            self.logger.warning(f"目录已存在: {directory_path}")
+            return False
+        except OSError as e:
             self.logger.error(f"创建目录失败: {directory_path}, 错误: {str(e)}")
             return False
+        
+        self.logger.info(f"创建目录成功: {directory_path}")
+        return True
     
     def list_files(self, directory_path, pattern='*', recursive=False):
         """列出目录中的文件
@@ -163,26 +521,17 @@ class FileUtils(SingletonBase):
             文件路径列表
         """
         try:
-            if not os.path.exists(directory_path):
-                self.logger.warning(f"目录不存在: {directory_path}")
-                return []
-            
-            import glob
-            
-            if recursive:
-                search_path = os.path.join(directory_path, '**', pattern)
-            else:
-                search_path = os.path.join(directory_path, pattern)
-            
-            files = glob.glob(search_path, recursive=recursive)
-            # 只返回文件，不包括目录
-            files = [f for f in files if os.path.isfile(f)]
-            
-            self.logger.debug(f"列出目录文件: {directory_path}, 找到 {len(files)} 个文件")
-            return files
-        except Exception as e:
+            files = list(_iter_files(directory_path, pattern, recursive))
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.warning(f"目录不存在: {directory_path}")
+            return []
+        except OSError as e:
             self.logger.error(f"列出目录文件失败: {directory_path}, 错误: {str(e)}")
             return []
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("列出目录文件: %s, 找到 %d 个文件", directory_path, len(files))
+        return files
     
     def copy_file(self, source_path, destination_path, overwrite=True):
         """复制文件
@@ -196,29 +545,30 @@ class FileUtils(SingletonBase):
             是否复制成功
         """
         try:
-            # 检查源文件是否存在
-            if not os.path.exists(source_path):
-                self.logger.error(f"源文件不存在: {source_path}")
-                return False
-            
-            # 检查目标文件是否已存在
-            if os.path.exists(destination_path) and not overwrite:
-                self.logger.warning(f"目标文件已存在且不允许覆盖: {destination_path}")
-                return False
-            
-            # 确保目标目录存在
-            destination_dir = os.path.dirname(destination_path)
-            if destination_dir and not os.path.exists(destination_dir):
-                os.makedirs(destination_dir)
-                self.logger.info(f"创建目录: {destination_dir}")
+            # 与shutil.copy2一致，目标为目录时复制到该目录下
+            if os.path.isdir(destination_path):
+                destination_path = os.path.join(destination_path, os.path.basename(source_path))
             
-            # 复制文件
-            shutil.copy2(source_path, destination_path)
-            self.logger.debug(f"复制文件成功: {source_path} -> {destination_path}")
-            return True
-        except Exception as e:
+            # 复制文件，目标目录不存在时创建后重试
+            try:
+                _copy_file(source_path, destination_path, overwrite)
+            except FileNotFoundError as e:
+                if e.filename == source_path:
+                    self.logger.error(f"源文件不存在: {source_path}")
+                    return False
+                if not self._ensure_parent_dir(destination_path):
+                    raise
+                _copy_file(source_path, destination_path, overwrite)
+        except FileExistsError:
+            self.logger.warning(f"目标文件已存在且不允许覆盖: {destination_path}")
+            return False
+        except OSError as e:
             self.logger.error(f"复制文件失败: {source_path} -> {destination_path}, 错误: {str(e)}")
             return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("复制文件成功: %s -> %s", source_path, destination_path)
+        return True
     
     def move_file(self, source_path, destination_path, overwrite=True):
         """移动文件
@@ -232,29 +582,28 @@ class FileUtils(SingletonBase):
             是否移动成功
         """
         try:
-            # 检查源文件是否存在
-            if not os.path.exists(source_path):
-                self.logger.error(f"源文件不存在: {source_path}")
-                return False
-            
             # 检查目标文件是否已存在
-            if os.path.exists(destination_path) and not overwrite:
+            if not overwrite and os.path.exists(destination_path):
                 self.logger.warning(f"目标文件已存在且不允许覆盖: {destination_path}")
                 return False
             
-            # 确保目标目录存在
-            destination_dir = os.path.dirname(destination_path)
-            if destination_dir and not os.path.exists(destination_dir):
-                os.makedirs(destination_dir)
-                self.logger.info(f"创建目录: {destination_dir}")
-            
-            # 移动文件
-            shutil.move(source_path, destination_path)
-            self.logger.debug(f"移动文件成功: {source_path} -> {destination_path}")
-            return True
-        except Exception as e:
+            # 移动文件，失败时再区分源文件不存在和目标目录不存在
+            try:
+                shutil.move(source_path, destination_path)
+            except FileNotFoundError:
+                if not os.path.lexists(source_path):
+                    self.logger.error(f"源文件不存在: {source_path}")
+                    return False
+                if not self._ensure_parent_dir(destination_path):
+                    raise
+                shutil.move(source_path, destination_path)
+        except OSError as e:
             self.logger.error(f"移动文件失败: {source_path} -> {destination_path}, 错误: {str(e)}")
             return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("移动文件成功: %s -> %s", source_path, destination_path)
+        return True
     
     def delete_file(self, file_path):
         """删除文件
@@ -266,16 +615,17 @@ class FileUtils(SingletonBase):
             是否删除成功
         """
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                self.logger.debug(f"删除文件成功: {file_path}")
-                return True
-            else:
-                self.logger.warning(f"文件不存在: {file_path}")
-                return False
-        except Exception as e:
+            os.remove(file_path)
+        except FileNotFoundError:
+            self.logger.warning(f"文件不存在: {file_path}")
+            return False
+        except OSError as e:
             self.logger.error(f"删除文件失败: {file_path}, 错误: {str(e)}")
             return False
+        
+        if self.logger.debug_enabled:
+            self.logger.debug("删除文件成功: %s", file_path)
+        return True
     
     def get_file_info(self, file_path):
         """获取文件信息
@@ -287,11 +637,15 @@ class FileUtils(SingletonBase):
             包含文件信息的字典
         """
         try:
-            if not os.path.exists(file_path):
-                self.logger.warning(f"文件不存在: {file_path}")
-                return None
-            
             stats = os.stat(file_path)
+        except FileNotFoundError:
+            self.logger.warning(f"文件不存在: {file_path}")
+            return None
+        except OSError as e:
+            self.logger.error(f"获取文件信息失败: {file_path}, 错误: {str(e)}")
+            return None
+        
+        try:
             return {
                 'path': file_path,
                 'name': os.path.basename(file_path),
@@ -301,6 +655,7 @@ class FileUtils(SingletonBase):
                 'accessed': datetime.fromtimestamp(stats.st_atime).strftime('%Y-%m-%d %H:%M:%S'),
                 'extension': os.path.splitext(file_path)[1].lower()
             }
-        except Exception as e:
+        except (OverflowError, OSError, ValueError) as e:
+            # 时间戳超出平台支持范围
             self.logger.error(f"获取文件信息失败: {file_path}, 错误: {str(e)}")
             return None
@@ -1,3 +1,6 @@
+import threading
+
+
 class SingletonMeta(type):
     """
     单例模式元类
@@ -5,6 +8,10 @@ class SingletonMeta(type):
     """
     
     _instances = {}
+    # 保护_locks的全局锁
+    _lock = threading.Lock()
+    # 每个类各自的构造锁，不同类的实例化互不阻塞
+    _locks = {}
     
     def __call__(cls, *args, **kwargs):
         """
@@ -16,11 +23,21 @@ class SingletonMeta(type):
             **kwargs: 关键字参数
             
         Returns:
-            类的唯一实例
+            类的唯一实例，已存在时直接返回，不再调用__init__
         """
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        
+        with SingletonMeta._lock:
+            class_lock = SingletonMeta._locks.setdefault(cls, threading.Lock())
+        
+        # 双重检查，避免多个线程同时创建实例
+        with class_lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+        return instance
 
 
 class SingletonBase(metaclass=SingletonMeta):
@@ -32,7 +49,7 @@ class SingletonBase(metaclass=SingletonMeta):
     def __init__(self):
         """
         初始化方法
-        注意：单例类的__init__方法会在每次获取实例时调用，
-        但只会创建一个实例对象
+        注意：__init__只在首次创建实例时调用，之后获取实例由元类直接返回，
+        子类无需再判断是否已初始化
         """
         pass
\ No newline at end of file
@@ -47,15 +47,15 @@ class App(QMainWindow):
         # 设置信号连接
         self._setup_signals()
         
+        # 初始化服务（需在UI之前，控制器使用同一个服务实例）
+        self._init_services()
+        
         # 初始化UI
         self._init_ui()
         
         # 加载配置
         self._load_configuration()
         
-        # 初始化服务
-        self._init_services()
-        
         # 初始化完成
         self.logger.info("应用程序初始化完成")
         self.signal_manager.emit_signal("app_initialized")
@@ -98,7 +98,7 @@ class App(QMainWindow):
             
             # 初始化主页面控制器和视图
             self.main_view = MainView()
-            self.main_controller = MainController(self.main_view)
+            self.main_controller = MainController(self.main_view, service=self.example_service)
             
             # 添加主页面视图到布局
             main_layout.addWidget(self.main_view)
@@ -168,8 +168,8 @@ class App(QMainWindow):
             self.config_manager.set("application.window_size", [self.width(), self.height()])
             # 保存窗口位置
             self.config_manager.set("application.window_position", [self.x(), self.y()])
-            # 保存配置到文件
-            self.config_manager.save_config()
+            # 立即将配置写入文件
+            self.config_manager.flush()
             self.logger.debug("配置保存完成")
         except Exception as e:
             self.logger.error(f"保存配置时出错: {str(e)}")